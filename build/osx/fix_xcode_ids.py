@@ -14,6 +14,10 @@ import os
 import sys
 import re
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'tools'))
+from write_if_changed import writeIfChanged
+
 USAGE = """fix_xcode_ids - Modifies an Xcode project in-place to use the same identifiers (based on name) instead of being different on each regeneration"
 Usage: fix_xcode_ids xcode_proj_dir"""
 
@@ -275,6 +279,4 @@ def repl(match):
 
 strOut = re.sub(idMask, repl, strIn)
 
-fout = open(projectFile, "w")
-fout.write(strOut)
-fout.close()
+writeIfChanged(projectFile, strOut)
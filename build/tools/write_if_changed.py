@@ -0,0 +1,112 @@
+#----------------------------------------------------------------------------
+# Name:         build/tools/write_if_changed.py
+# Purpose:      Helpers for writing generated files only if they changed.
+# Author:       wxWidgets development team
+# Created:      2026-10-17
+# Copyright:    (c) 2026 wxWidgets development team
+# Licence:      wxWindows licence
+#----------------------------------------------------------------------------
+
+"""
+Helpers used by the scripts generating files in wxWidgets source tree.
+
+The generated files are never modified if their contents doesn't change, so
+that their timestamps are preserved and everything depending on them doesn't
+need to be rebuilt. When they do change, the new contents is written to a
+temporary file in the same directory which then atomically replaces the
+existing file, so that it is never left partially written.
+
+Scripts outside of this directory can use this module by adding it to
+sys.path, e.g.
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..',
+                                    'build', 'tools'))
+    from write_if_changed import writeIfChanged
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+
+def fileDigest(filename):
+    """Return the SHA-1 digest of the file contents or None if it is absent."""
+    try:
+        f = open(filename, 'rb')
+    except IOError:
+        return None
+
+    try:
+        digest = hashlib.sha1()
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            digest.update(chunk)
+        return digest.hexdigest()
+    finally:
+        f.close()
+
+
+def _replaceFile(src, dst):
+    if sys.version_info >= (3, 3):
+        os.replace(src, dst)
+    else:
+        # rename() can't overwrite an existing file under Windows
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def _copyMode(src, dst):
+    """Give dst the permissions of src if it exists or the default ones."""
+    try:
+        mode = os.stat(src).st_mode & 0o7777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(dst, mode)
+
+
+def writeStreamIfChanged(filename, writer, mode='w'):
+    """Update the file with the contents written by writer if it changed.
+
+    The writer is called with a file object opened in the given mode for a
+    temporary file and must write the new contents of the file to it.
+
+    Return True if the file was modified or created or False if it already
+    had exactly the same contents.
+    """
+    dirname, basename = os.path.split(os.path.abspath(filename))
+    fd, tmpname = tempfile.mkstemp(prefix='.' + basename + '.',
+                                   suffix='.tmp', dir=dirname)
+    try:
+        f = os.fdopen(fd, mode)
+        try:
+            writer(f)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            f.close()
+
+        if fileDigest(tmpname) == fileDigest(filename):
+            os.remove(tmpname)
+            return False
+
+        _copyMode(filename, tmpname)
+        _replaceFile(tmpname, filename)
+        return True
+    except:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+        raise
+
+
+def writeIfChanged(filename, text, mode='w'):
+    """Update the file with the given text if it changed.
+
+    Return True if the file was modified or created or False otherwise.
+    """
+    return writeStreamIfChanged(filename, lambda f: f.write(text), mode)
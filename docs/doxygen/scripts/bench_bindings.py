@@ -0,0 +1,189 @@
+"""
+Name: bench_bindings.py
+Author: wxWidgets development team
+Licence: wxWindows licence
+"""
+
+from __future__ import print_function
+
+__description__ = """
+Measures the time taken by the bindings generators to produce the text for
+the largest classes found in the given Doxygen XML files.
+
+Each emitter is compared with the reference implementation building the
+text by appending to a string in a loop, as the emitters did before they
+were changed to generate the text fragments.
+
+The classes can be made artificially bigger by repeating their methods and
+enum values the given number of times, e.g.
+
+python bench_bindings.py --scale=10 out/xml/classwx_window.xml out/xml/classwx_styled_text_ctrl.xml
+"""
+
+import optparse
+import sys
+import timeit
+
+import c_tools
+import doxymlparser
+import sip_tools
+import swig_tools
+
+from common import *
+
+def scale_class(aclass, scale):
+    aclass.constructors = aclass.constructors * scale
+    aclass.methods = aclass.methods * scale
+    for enum in aclass.enums:
+        aclass.enums[enum] = ["%s_%d" % (value, n)
+                              for n in range(scale)
+                              for value in aclass.enums[enum]]
+
+# The reference implementations of the emitters, producing the same text as
+# the current ones.
+def reference_enums(aclass):
+    retval = ""
+    for enum in aclass.enums:
+        retval += "enum %s {\n" % enum
+        for value in aclass.enums[enum]:
+            retval += "    %s" % value
+            if not value == aclass.enums[enum][-1]:
+                retval += ", "
+            retval += "\n"
+        retval += "};\n\n"
+
+    return retval
+
+def reference_sip_methods(sip, aclass):
+    retval = ""
+
+    ctor_transfer = ""
+    if sip.doxyparser.is_derived_from_base(aclass, "wxWindow"):
+        ctor_transfer = "/Transfer/"
+
+    num_ctors = len(aclass.constructors)
+    for index, amethod in enumerate(aclass.constructors + aclass.methods):
+        transfer = ""
+
+        if ignored_methods_filter.matches(aclass.name, amethod):
+            continue
+
+        if index < num_ctors:
+            transfer = ctor_transfer
+
+        if amethod.name.startswith("operator"):
+            continue
+
+        retval += "    %s %s%s%s;\n\n" % (amethod.return_type.replace("virtual ", ""), amethod.name, amethod.argsstring, transfer)
+
+    return retval
+
+def reference_swig_methods(aclass):
+    retval = """
+    %%pythonAppend %s    "self._setOORInfo(self)"
+    %%pythonAppend %s() ""
+    %%typemap(out) %s*; // turn off this typemap
+    """ % (aclass.name, aclass.name, aclass.name)
+
+    for amethod in aclass.constructors:
+        retval += "    %s%s;\n\n" % (amethod.name, amethod.argsstring)
+
+    retval += """
+        // Turn it back on again
+        %%typemap(out) %s* { $result = wxPyMake_wxObject($1, $owner); }
+    """ % aclass.name
+
+    for amethod in aclass.methods:
+        retval += "    %s %s%s;\n\n" % (amethod.return_type, amethod.name, amethod.argsstring)
+
+    return retval
+
+def reference_c_methods(aclass):
+    retval = ""
+    wxc_classname = 'wxC' + aclass.name[2:].capitalize()
+
+    for amethod in aclass.constructors:
+        retval += """
+// %s
+%s%s;\n\n
+""" % (c_tools.make_c_comment(amethod), wxc_classname + '* ' + wxc_classname + '_' + amethod.name, amethod.argsstring)
+
+    for amethod in aclass.methods:
+        if amethod.name.startswith('m_'):
+            continue
+
+        args = '(' + wxc_classname + '* obj'
+        if amethod.argsstring.find('()') != -1:
+            args += ')'
+        else:
+            args += ', ' + amethod.argsstring[1:].strip()
+
+        retval += """
+// %s
+%s %s%s;\n
+""" % (c_tools.make_c_comment(amethod), amethod.return_type, wxc_classname + '_' + amethod.name, args)
+
+    return retval
+
+def get_class_size(aclass):
+    return len(aclass.constructors) + len(aclass.methods) + \
+           sum([len(values) for values in aclass.enums.values()])
+
+if __name__ == "__main__":
+    option_dict = {
+                "scale"         : (1, "Number of times to repeat the methods and enum values of each class."),
+                "repeat"        : (5, "Number of runs, the best time is reported."),
+                "count"         : (3, "Number of the largest classes to use."),
+              }
+
+    parser = optparse.OptionParser(usage="usage: %prog [options] <doxyml files to parse>\n" + __description__, version="%prog 1.0")
+
+    for opt in option_dict:
+        default = option_dict[opt][0]
+
+        action = "store"
+        opttype = None
+        if isinstance(default, bool):
+            action = "store_true"
+        elif isinstance(default, int):
+            opttype = "int"
+        parser.add_option("--" + opt, default=default, action=action, type=opttype, dest=opt, help=option_dict[opt][1])
+
+    options, arguments = parser.parse_args()
+
+    if len(arguments) < 1:
+        parser.print_usage()
+        sys.exit(1)
+
+    doxyparse = doxymlparser.DoxyMLParser()
+    doxyparse.parse_files(arguments)
+
+    classes = sorted(doxyparse.classes, key=get_class_size, reverse=True)[:options.count]
+    for aclass in classes:
+        scale_class(aclass, options.scale)
+
+    sip = sip_tools.SIPBuilder(doxyparse, "")
+    swig = swig_tools.SWIGBuilder(doxyparse, "")
+    c = c_tools.CBuilder(doxyparse, "")
+    # each emitter is given together with its reference implementation
+    emitters = (
+        ("enums", make_enums, reference_enums),
+        ("sip", sip.make_sip_methods, lambda aclass: reference_sip_methods(sip, aclass)),
+        ("swig", swig.make_swig_methods, reference_swig_methods),
+        ("c", c.make_c_methods, reference_c_methods),
+    )
+
+    for aclass in classes:
+        print("%s: %d methods, %d enum values" % (aclass.name,
+            len(aclass.constructors) + len(aclass.methods),
+            sum([len(values) for values in aclass.enums.values()])))
+        for name, emitter, reference in emitters:
+            if emitter(aclass) != reference(aclass):
+                print("    %-10s output differs from the reference one" % name)
+                continue
+
+            times = timeit.repeat(lambda: emitter(aclass), repeat=options.repeat, number=1)
+            reference_times = timeit.repeat(lambda: reference(aclass), repeat=options.repeat, number=1)
+            print("    %-10s %9.2f ms (reference %9.2f ms, speedup %5.2fx)" %
+                  (name, min(times) * 1000, min(reference_times) * 1000,
+                   min(reference_times) / max(min(times), 1e-9)))
@@ -7,53 +7,77 @@ import os
 
 from common import *
 
+def make_c_comment(amethod):
+    # use both the brief and detailed descriptions, if any, and continue the
+    # comment on all the lines of a multiline description
+    text = "\n".join([description
+                      for description in (amethod.brief_description, amethod.detailed_description)
+                      if description])
+    return "\n// ".join(text.splitlines())
+
 class CBuilder:
     def __init__(self, doxyparse, outputdir):
         self.doxyparser = doxyparse
         self.output_dir = outputdir
 
     def make_bindings(self):
+        self.begin()
+        for aclass in self.doxyparser.classes:
+            self.make_class(ClassInfo(self.doxyparser, aclass))
+        self.end()
+
+    def begin(self, prune=False):
         output_dir = os.path.abspath(os.path.join(self.output_dir, "c"))
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        for aclass in self.doxyparser.classes:
-            # This bit doesn't work, because the aclass.name is not the same as
-            # those listed in common
-            if aclass.name in excluded_classes:
-                #print "Skipping %s" % aclass.name
-                continue
+        self.manifest = OutputManifest(output_dir, prune=prune)
+
+    def make_class(self, info):
+        if info.excluded:
+            #print("Skipping %s" % info.name)
+            return
 
-            self.make_c_header(output_dir, aclass)
+        self.make_c_header(self.manifest.output_dir, info.aclass, self.manifest, info.enums_text)
 
+    def end(self):
+        self.manifest.save([aclass.name for aclass in self.doxyparser.classes])
 
-    def make_c_header(self, output_dir, aclass):
+    def make_c_header(self, output_dir, aclass, manifest=None, enums_text=None):
             filename = os.path.join(output_dir, aclass.name[2:].lower() + ".hh")
-            enums_text = make_enums(aclass)
-            method_text = self.make_c_methods(aclass)
-            class_name = aclass.name[2:].capitalize()
-            text = """
+            if enums_text is None:
+                enums_text = make_enums(aclass)
+            fragments = self.iter_c_header(aclass, enums_text)
+
+            if manifest:
+                manifest.write_file(aclass.name, filename, fragments)
+            else:
+                write_output(filename, fragments)
+
+    def iter_c_header(self, aclass, enums_text):
+        yield """
 // Enums
 %s
 
-%s
-""" % (enums_text, method_text)
+""" % enums_text
+
+        for fragment in self.iter_c_methods(aclass):
+            yield fragment
 
-            afile = open(filename, "wb")
-            afile.write(text)
-            afile.close()
+        yield "\n"
 
 
     def make_c_methods(self, aclass):
-        retval = ""
+        return "".join(self.iter_c_methods(aclass))
 
+    def iter_c_methods(self, aclass):
         wxc_classname = 'wxC' + aclass.name[2:].capitalize()
 
         for amethod in aclass.constructors:
-            retval += """
+            yield """
 // %s
 %s%s;\n\n
-""" % (amethod.brief_description, wxc_classname + '* ' + wxc_classname + '_' + amethod.name, amethod.argsstring)
+""" % (make_c_comment(amethod), wxc_classname + '* ' + wxc_classname + '_' + amethod.name, amethod.argsstring)
 
         for amethod in aclass.methods:
             if amethod.name.startswith('m_'):
@@ -66,9 +90,7 @@ class CBuilder:
             else:
                 args += ', ' + amethod.argsstring[1:].strip()
 
-            retval += """
+            yield """
 // %s
 %s %s%s;\n
-""" % (amethod.detailed_description, amethod.return_type, wxc_classname + '_' + amethod.name, args)
-
-        return retval
+""" % (make_c_comment(amethod), amethod.return_type, wxc_classname + '_' + amethod.name, args)
@@ -0,0 +1,136 @@
+"""
+Name: check_bindings.py
+Author: wxWidgets development team
+Licence: wxWindows licence
+"""
+
+from __future__ import print_function
+
+__description__ = """
+Generates the bindings for the Doxygen XML files in testdata/xml, given both
+individually and using index.xml, and checks that they are exactly the same
+as the expected ones in testdata/expected. Also checks that regenerating the
+bindings for just one of the classes leaves all the other ones untouched.
+
+This allows to check that the bindings generated by different Python versions
+are identical and that changes to the scripts don't modify the generated
+bindings unexpectedly. If they are supposed to change, use --update option to
+update the expected files.
+"""
+
+import difflib
+import glob
+import optparse
+import os
+import shutil
+import sys
+import tempfile
+
+import c_tools
+import doxymlparser
+import make_bindings
+import sip_tools
+import swig_tools
+
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testdata")
+XML_DIR = os.path.join(TESTDATA_DIR, "xml")
+EXPECTED_DIR = os.path.join(TESTDATA_DIR, "expected")
+
+def generate(output_dir, jobs=1, threads=1, use_index=False, filenames=None):
+    doxyparse = doxymlparser.DoxyMLParser()
+    if use_index:
+        doxyparse.parse_index(os.path.join(XML_DIR, "index.xml"), jobs)
+    else:
+        if filenames is None:
+            filenames = sorted(glob.glob(os.path.join(XML_DIR, "classwx_*.xml")))
+        doxyparse.parse_files(filenames, jobs)
+
+    builders = [
+        sip_tools.SIPBuilder(doxyparse, output_dir),
+        swig_tools.SWIGBuilder(doxyparse, output_dir),
+        c_tools.CBuilder(doxyparse, output_dir),
+    ]
+    make_bindings.make_bindings(doxyparse, builders, threads)
+
+def list_files(top):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        for filename in filenames:
+            files.append(os.path.relpath(os.path.join(dirpath, filename), top))
+    return sorted(files)
+
+def read_lines(filename):
+    f = open(filename, "rb")
+    try:
+        return f.read().decode("utf-8").splitlines(True)
+    finally:
+        f.close()
+
+def compare(expected_dir, output_dir):
+    """
+    Return the list of the differences between the files in the two
+    directories, empty if they're identical.
+    """
+    diffs = []
+    expected = list_files(expected_dir)
+    actual = list_files(output_dir)
+    for name in sorted(set(expected) - set(actual)):
+        diffs.append("missing file %s\n" % name)
+    for name in sorted(set(actual) - set(expected)):
+        diffs.append("unexpected file %s\n" % name)
+
+    for name in sorted(set(expected) & set(actual)):
+        diffs.extend(difflib.unified_diff(read_lines(os.path.join(expected_dir, name)),
+                                          read_lines(os.path.join(output_dir, name)),
+                                          "expected/" + name, "actual/" + name))
+
+    return diffs
+
+if __name__ == "__main__":
+    option_dict = {
+                "update"        : (False, "Update the expected files instead of checking them."),
+                "jobs"          : (1, "Number of processes to use for parsing the XML files."),
+                "threads"       : (1, "Number of threads to use for generating the different kinds of bindings."),
+              }
+
+    parser = optparse.OptionParser(usage="usage: %prog [options]\n" + __description__, version="%prog 1.0")
+
+    for opt in option_dict:
+        default = option_dict[opt][0]
+
+        action = "store"
+        opttype = None
+        if isinstance(default, bool):
+            action = "store_true"
+        elif isinstance(default, int):
+            opttype = "int"
+        parser.add_option("--" + opt, default=default, action=action, type=opttype, dest=opt, help=option_dict[opt][1])
+
+    options, arguments = parser.parse_args()
+
+    if options.update:
+        if os.path.exists(EXPECTED_DIR):
+            shutil.rmtree(EXPECTED_DIR)
+        generate(EXPECTED_DIR, options.jobs, options.threads)
+        sys.exit(0)
+
+    diffs = []
+    for use_index in (False, True):
+        output_dir = tempfile.mkdtemp(prefix="check_bindings")
+        try:
+            generate(output_dir, options.jobs, options.threads, use_index)
+            diffs.extend(compare(EXPECTED_DIR, output_dir))
+
+            if not use_index:
+                generate(output_dir, options.jobs, options.threads,
+                         filenames=[os.path.join(XML_DIR, "classwx_point.xml")])
+                diffs.extend(compare(EXPECTED_DIR, output_dir))
+        finally:
+            shutil.rmtree(output_dir)
+
+    if diffs:
+        sys.stdout.writelines(diffs)
+        print("Generated bindings differ from the expected ones.")
+        sys.exit(1)
+
+    print("Generated bindings are the same as the expected ones.")
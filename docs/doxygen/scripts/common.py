@@ -1,11 +1,33 @@
+from __future__ import print_function
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "..", "..", "build", "tools"))
+from write_if_changed import fileDigest, writeIfChanged
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
 # format: class : {method : (prototype1, prototype2)}
-# using a "*" means all prototypes
+# where each prototype is the list of the types of the first parameters of the
+# method, using a "*" instead of the prototypes tuple means all prototypes
 ignored_methods = {
     "wxIcon": {'wxIcon': (['const char', 'int', 'int'], )},
 }
 
 # these classes are either replaced by different data types in bindings, or have equivalent / better
 # functionality provided by the target language.
+#
+# Besides the class names, this list can contain glob patterns, e.g. "wxFoo*",
+# and regular expressions prefixed with "re:", e.g. "re:wx.*Stream$".
 excluded_classes = [
         "wxAny",
         "wxAnyValueType",
@@ -149,16 +171,235 @@ def get_first_value(alist):
     else:
         return ""
 
-def make_enums(aclass):
-    retval = ""
+def iter_enums(aclass):
+    """
+    Generate the fragments of the declarations of all the enums of the class.
+    """
     for enum in aclass.enums:
-        retval += "enum %s {\n" % enum
-        num_values = len(aclass.enums[enum])
-        for value in aclass.enums[enum]:
-            retval += "    %s" % value
-            if not value == aclass.enums[enum][-1]:
-                retval += ", "
-            retval += "\n"
-        retval += "};\n\n"
-
-    return retval
+        values = aclass.enums[enum]
+        yield "enum %s {\n" % enum
+        for value in values:
+            if not value == values[-1]:
+                yield "    %s, \n" % value
+            else:
+                yield "    %s\n" % value
+        yield "};\n\n"
+
+def make_enums(aclass):
+    return "".join(iter_enums(aclass))
+
+_name_spaces_regex = re.compile(r"\s*([<>,*&:()\[\]])\s*")
+
+def normalize_name(name):
+    """
+    Return the class or type name without any insignificant white space, so
+    that e.g. "wxVector< T >" and "wxVector<T>" are considered the same.
+    """
+    return _name_spaces_regex.sub(r"\1", " ".join(name.split()))
+
+class NameFilter:
+    """
+    Checks whether the class names match any of the given names or patterns,
+    see excluded_classes for their format.
+
+    The names are compared after normalizing them, the results of matching
+    the patterns are cached.
+    """
+    def __init__(self, patterns):
+        self.names = set()
+        self.regexes = []
+        self.matched = {}
+        for pattern in patterns:
+            if pattern.startswith("re:"):
+                self.regexes.append(re.compile(pattern[3:]))
+            elif "*" in pattern or "?" in pattern or "[" in pattern:
+                self.regexes.append(re.compile(fnmatch.translate(normalize_name(pattern))))
+            else:
+                self.names.add(normalize_name(pattern))
+
+    def matches(self, name):
+        name = normalize_name(name)
+        if name in self.names:
+            return True
+
+        result = self.matched.get(name)
+        if result is None:
+            result = False
+            for regex in self.regexes:
+                if regex.match(name):
+                    result = True
+                    break
+            self.matched[name] = result
+
+        return result
+
+class MethodFilter:
+    """
+    Checks whether the methods should be ignored according to the rules in
+    the format of ignored_methods.
+    """
+    def __init__(self, rules):
+        # maps (class name, method name) to None if all the prototypes are
+        # ignored or the set of the ignored prototypes, represented by the
+        # tuples of their normalized parameters types
+        self.rules = {}
+
+        # all the different lengths of the prototypes, in ascending order
+        self.lengths = set()
+
+        for class_name, methods in rules.items():
+            for method_name, prototypes in methods.items():
+                key = (normalize_name(class_name), method_name)
+                if prototypes == "*":
+                    self.rules[key] = None
+                    continue
+
+                ignored = self.rules.setdefault(key, set())
+                if ignored is None:
+                    continue
+
+                for prototype in prototypes:
+                    ignored.add(tuple(normalize_name(t) for t in prototype))
+                    self.lengths.add(len(prototype))
+
+        self.lengths = sorted(self.lengths)
+
+        # cache of the normalized class names
+        self.class_names = {}
+
+    def matches(self, class_name, amethod):
+        normalized = self.class_names.get(class_name)
+        if normalized is None:
+            normalized = self.class_names.setdefault(class_name, normalize_name(class_name))
+
+        key = (normalized, amethod.name)
+        if key not in self.rules:
+            return False
+
+        ignored = self.rules[key]
+        if ignored is None:
+            return True
+
+        types = tuple(normalize_name(param.get("type", "")) for param in amethod.params)
+        for length in self.lengths:
+            if length > len(types):
+                break
+            if types[:length] in ignored:
+                return True
+
+        return False
+
+excluded_classes_filter = NameFilter(excluded_classes)
+ignored_methods_filter = MethodFilter(ignored_methods)
+
+def to_bytes(text):
+    """
+    Return the text encoded in UTF-8 unless it is already a bytes string.
+    """
+    if isinstance(text, bytes):
+        return text
+    return text.encode("utf-8")
+
+def write_output(filename, fragments):
+    """
+    Write the text, given either as a single string or as an iterable of its
+    fragments, to the file using UTF-8 encoding and without translating the
+    new lines, if it changed. Returns True if the file was modified.
+
+    The text is compared with the existing file contents in memory, so that
+    nothing at all is written if it didn't change.
+    """
+    if isinstance(fragments, string_types):
+        data = to_bytes(fragments)
+    else:
+        data = b"".join([to_bytes(fragment) for fragment in fragments])
+
+    if hashlib.sha1(data).hexdigest() == fileDigest(filename):
+        return False
+    return writeIfChanged(filename, data, "wb")
+
+class ClassInfo:
+    """
+    The data about the class used by all the bindings builders, computed only
+    once for each class when generating several kinds of bindings.
+    """
+    def __init__(self, doxyparse, aclass):
+        self.aclass = aclass
+        self.name = aclass.name
+        self.excluded = excluded_classes_filter.matches(aclass.name)
+        self.header_name = aclass.name[2:].lower()
+        self.enums_text = make_enums(aclass)
+        self.base = get_first_value(aclass.bases)
+        self.include = get_first_value(aclass.includes)
+
+        # whether the class derives from wxWindow, see SIPBuilder
+        self.is_window = doxyparse.is_derived_from_base(aclass, "wxWindow")
+
+class OutputManifest:
+    """
+    Writes the files generated for the classes into the given directory and
+    keeps track of them in a manifest file in the same directory.
+
+    The files are only modified if their contents changes and the files
+    generated during the previous run for the classes parsed during this one,
+    but not generated now, e.g. because the class was excluded, are deleted
+    by save(). The files of the classes which were not parsed at all are kept,
+    as only some of the classes may be processed, unless prune is true.
+    """
+    def __init__(self, output_dir, name=".manifest.json", prune=False):
+        self.output_dir = output_dir
+        self.filename = os.path.join(output_dir, name)
+        self.prune = prune
+        self.files = {}
+
+        self.old_files = {}
+        if os.path.exists(self.filename):
+            try:
+                self.old_files = json.load(open(self.filename))["files"]
+            except (ValueError, KeyError):
+                # just don't prune anything if the manifest is invalid
+                pass
+
+    def write_file(self, class_name, filename, fragments):
+        """
+        Write the text generated for the given class to the file if it
+        changed, returns True if the file was modified.
+
+        The text can be given either as a single string or as an iterable of
+        its fragments.
+        """
+        name = os.path.relpath(filename, self.output_dir)
+        self.files.setdefault(name, []).append(class_name)
+        return write_output(filename, fragments)
+
+    def save(self, class_names=()):
+        """
+        Remove the stale files and save the manifest.
+
+        The class_names are the names of all the classes parsed during this
+        run, including those for which no files were written.
+
+        Returns the list of the removed files names.
+        """
+        parsed = set(class_names)
+        removed = []
+        for name in sorted(self.old_files):
+            if name in self.files:
+                continue
+
+            path = os.path.join(self.output_dir, name)
+            if not os.path.exists(path):
+                continue
+
+            old_classes = self.old_files[name]
+            if self.prune or all(class_name in parsed for class_name in old_classes):
+                os.remove(path)
+                removed.append(name)
+            else:
+                # keep the files of the classes not processed during this run
+                self.files[name] = old_classes
+
+        write_output(self.filename,
+                     json.dumps({"files": self.files}, indent=1,
+                                separators=(",", ": "), sort_keys=True) + "\n")
+        return removed
@@ -4,6 +4,8 @@ Author: Kevin Ollivier
 Licence: wxWindows licence
 """
 
+from __future__ import print_function
+
 __description__ = """
 Takes the output of Doxygen XML and parses it to retrieve metadata about the classes and methods.
 
@@ -14,20 +16,79 @@ To create the Doxygen XML files, from the wxWidgets/docs/doxygen directory, do:
 To see the results from parsing a particular class, do:
 
 python doxymlparser.py --report out/xml/classwx_<whatever>.xml
+
+or, to parse all the classes, do:
+
+python doxymlparser.py --report --index=out/xml/index.xml
 """
 
 #!/usr/bin/env python
+import multiprocessing
 import optparse
 import os
-import string
-
+import re
 import sys
-import types
+
+from collections import OrderedDict
 
 from common import *
-from xml.dom import minidom
 
-class ClassDefinition:
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
+
+# this module is found thanks to the path set up in common
+from write_if_changed import fileDigest, writeStreamIfChanged
+
+class SlotsObject(object):
+    """
+    Base class for the objects using __slots__ which need to be pickled to be
+    passed between processes.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return dict((slot, getattr(self, slot))
+                    for cls in type(self).__mro__
+                    for slot in getattr(cls, "__slots__", ()))
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+class DocText(SlotsObject):
+    """
+    Description extracted from Doxygen XML.
+
+    The paragraphs are (kind, argument, runs) tuples, where the kind is None
+    for the normal paragraphs, "item" for the list items, "code" for the code
+    lines, "param" for the parameter descriptions, with the parameter names
+    as argument, or the kind of the simple section, e.g. "return" or "see".
+    The runs are lists of (style, text) pairs, with the style being one of
+    "text", "ref", "code", "emphasis" or "bold".
+
+    The text is the plain text rendering of all the paragraphs, one per line.
+    """
+    __slots__ = ("paragraphs", "text")
+
+    def __init__(self, paragraphs=None, text=""):
+        self.paragraphs = paragraphs or []
+        self.text = text
+
+emptyDocText = DocText()
+
+class ClassDefinition(SlotsObject):
+    __slots__ = ("name", "constructors", "destructors", "methods",
+                 "brief_description", "detailed_description", "brief_doc",
+                 "detailed_doc", "includes", "bases", "enums",
+                 "method_index", "overloads")
+
     def __init__(self):
         self.name = ""
         self.constructors = []
@@ -35,9 +96,40 @@ class ClassDefinition:
         self.methods = []
         self.brief_description = ""
         self.detailed_description = ""
+        self.brief_doc = emptyDocText
+        self.detailed_doc = emptyDocText
         self.includes = []
         self.bases = []
-        self.enums = {}
+        # use ordered dictionary to always output the enums in the same order
+        self.enums = OrderedDict()
+
+        # all the constructors, destructors and methods indexed by their
+        # signature keys, see MethodDefinition.get_signature_key()
+        self.method_index = {}
+
+        # lists of the constructors, destructors and methods with different
+        # signatures indexed by their names, in the order of their appearance
+        self.overloads = OrderedDict()
+
+    def add_to_index(self, method):
+        """
+        Add the method to the index and return True or just return False if
+        a method with the same signature had been already added.
+        """
+        key = method.get_signature_key()
+        if key in self.method_index:
+            return False
+
+        self.method_index[key] = method
+        self.overloads.setdefault(method.name, []).append(method)
+        return True
+
+    def find_method(self, name, param_types, is_const=False):
+        """
+        Return the method with the given name, parameter types and constness
+        or None if there is no such method.
+        """
+        return self.method_index.get((name, tuple(normalize_name(t) for t in param_types), is_const))
 
     def __str__(self):
         str_repr = """
@@ -49,7 +141,7 @@ Brief Description:
 
 Detailed Description:
 %s
-""" % (self.name, string.join(self.bases, ", "), self.includes, self.brief_description, self.detailed_description)
+""" % (self.name, ", ".join(self.bases), self.includes, self.brief_description, self.detailed_description)
         str_repr += "Methods:\n"
 
         for method in self.methods:
@@ -57,7 +149,11 @@ Detailed Description:
 
         return str_repr
 
-class MethodDefinition:
+class MethodDefinition(SlotsObject):
+    __slots__ = ("name", "return_type", "argsstring", "definition", "params",
+                 "brief_description", "detailed_description", "brief_doc",
+                 "detailed_doc", "is_const")
+
     def __init__(self):
         self.name = ""
         self.return_type = ""
@@ -66,6 +162,20 @@ class MethodDefinition:
         self.params = []
         self.brief_description = ""
         self.detailed_description = ""
+        self.brief_doc = emptyDocText
+        self.detailed_doc = emptyDocText
+        self.is_const = False
+
+    def get_signature_key(self):
+        """
+        Return the key identifying the method among all the methods of its
+        class: the tuple of its name, the tuple of its normalized parameters
+        types, including their array suffixes if any, and its constness.
+        """
+        return (self.name,
+                tuple(normalize_name(param.get("type", "") + param.get("array", ""))
+                      for param in self.params),
+                self.is_const)
 
     def __str__(self):
         str_repr = """
@@ -82,126 +192,544 @@ Detailed Description:
         return str_repr
 
 def getTextValue(node, recursive=False):
-    text = ""
-    for child in node.childNodes:
-        if child.nodeType == child.ELEMENT_NODE and child.nodeName == "ref":
-            text += getTextValue(child)
-        if child.nodeType == child.TEXT_NODE:
-            # Add a space to ensure we have a space between qualifiers and parameter names
-            text += child.nodeValue.strip() + " "
-
-    return text.strip()
+    # most of the nodes, e.g. names, don't have any children
+    if len(node) == 0:
+        if node.text is None:
+            return ""
+        return node.text.strip()
+
+    # Add a space after each text fragment to ensure we have a space between
+    # qualifiers and parameter names, but not after the referenced names
+    parts = []
+    if node.text is not None:
+        parts.append(node.text.strip())
+        parts.append(" ")
+    for child in node:
+        if child.tag == "ref":
+            parts.append(getTextValue(child))
+        if child.tail is not None:
+            parts.append(child.tail.strip())
+            parts.append(" ")
+
+    return "".join(parts).strip()
+
+# The elements starting new paragraphs in the descriptions
+docBlockTags = ("para", "listitem", "simplesect", "parameteritem",
+                "programlisting", "codeline")
+
+# The styles of the text of the inline elements in the descriptions
+docInlineStyles = {
+    "ref"           : "ref",
+    "computeroutput": "code",
+    "emphasis"      : "emphasis",
+    "bold"          : "bold",
+}
+
+# The elements whose contents is not part of the description text
+docIgnoredTags = ("anchor", "indexentry", "parameternamelist", "xreftitle")
+
+whitespaceRegEx = re.compile(r"\s+")
+
+def parseDoc(node):
+    """
+    Return DocText for the given Doxygen description element, e.g.
+    briefdescription, extracting both its paragraphs and its text in a single
+    pass over it.
+    """
+    paragraphs = []
+    current = [None]
+
+    def add(text, kind, arg, style):
+        if kind != "code":
+            text = whitespaceRegEx.sub(" ", text)
+            if current[0] is None:
+                text = text.lstrip()
+        if not text:
+            return
+
+        if current[0] is None:
+            current[0] = []
+            paragraphs.append((kind, arg, current[0]))
+        current[0].append((style, text))
+
+    def walk(node, kind, arg, style):
+        tag = node.tag
+        block = tag in docBlockTags
+        if block:
+            current[0] = None
+            if tag == "listitem":
+                kind = "item"
+            elif tag == "programlisting":
+                kind = "code"
+            elif tag == "simplesect":
+                kind, arg = node.get("kind"), None
+            elif tag == "parameteritem":
+                kind, arg = "param", ", ".join([getTextValue(name) for name in node.iter("parametername")])
+        elif tag in ("sp", "linebreak"):
+            add(" ", kind, arg, style)
+
+        style = docInlineStyles.get(tag, style)
+        if node.text is not None:
+            add(node.text, kind, arg, style)
+        for child in node:
+            if child.tag not in docIgnoredTags:
+                walk(child, kind, arg, style)
+            if child.tail is not None:
+                add(child.tail, kind, arg, style)
+
+        if block:
+            current[0] = None
+
+    walk(node, None, None, "text")
+
+    lines = []
+    for kind, arg, runs in paragraphs:
+        text = "".join([text for style, text in runs]).rstrip()
+        if kind == "item":
+            text = "- " + text
+        elif kind == "param":
+            text = "@param %s %s" % (arg, text)
+        elif kind is not None and kind != "code":
+            text = "@%s %s" % (kind, text)
+        lines.append(text)
+
+    return DocText(paragraphs, "\n".join(lines))
 
 def doxyMLToText(node):
-    return text
+    return parseDoc(node).text
+
+# The elements containing the compounds and their members in Doxygen output
+compoundContainers = ("doxygen", "compounddef", "sectiondef")
+
+def iterElements(filename, containers=compoundContainers):
+    """
+    Iterate over the children of all the elements with the tags from the
+    given containers list in the file, yielding each of them, with all its
+    contents, together with its parent as soon as its end tag is parsed.
+
+    The yielded elements are removed from the tree after being processed, so
+    that the memory used doesn't depend on the size of the file.
+    """
+    path = []
+    for event, node in ElementTree.iterparse(filename, events=("start", "end")):
+        if event == "start":
+            path.append(node)
+            continue
+
+        path.pop()
+        if path and path[-1].tag in containers:
+            yield node, path[-1]
+            path[-1].remove(node)
+
+class ParseCache(object):
+    """
+    Cache of the data parsed from XML files, stored on disk between runs.
+
+    The data is stored in pickled form for each file, together with its size,
+    modification time and contents digest. It is reused if the size and time
+    didn't change or, if only the time did, the digest is still the same.
+    """
+    VERSION = 4
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.entries = {}
+        self.modified = False
+
+        try:
+            f = open(filename, "rb")
+        except IOError:
+            return
+
+        try:
+            try:
+                key, entries = pickle.load(f)
+            except Exception:
+                # corrupted or written by an incompatible version, ignore it
+                return
+        finally:
+            f.close()
+
+        # the strings stored by different Python versions are not compatible
+        if key == (self.VERSION, sys.version_info[0]):
+            self.entries = entries
+
+    def get(self, filename):
+        """
+        Return the data cached for the given file or None if there is no
+        data for it or if it is out of date.
+        """
+        path = os.path.abspath(filename)
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+
+        size, mtime, digest, data = entry
+        st = os.stat(path)
+        if st.st_size != size:
+            return None
+
+        if st.st_mtime != mtime:
+            if fileDigest(path) != digest:
+                return None
+
+            # the file was only touched, remember its new time to avoid
+            # computing the digest again the next time
+            self.entries[path] = (size, st.st_mtime, digest, data)
+            self.modified = True
+
+        try:
+            return pickle.loads(data)
+        except Exception:
+            return None
+
+    def put(self, filename, data):
+        path = os.path.abspath(filename)
+        st = os.stat(path)
+        self.entries[path] = (st.st_size, st.st_mtime, fileDigest(path),
+                              pickle.dumps(data, 2))
+        self.modified = True
+
+    def save(self):
+        # forget about the files which don't exist any longer
+        for path in list(self.entries.keys()):
+            if not os.path.exists(path):
+                del self.entries[path]
+                self.modified = True
+
+        if self.modified:
+            writeStreamIfChanged(self.filename,
+                                 lambda f: pickle.dump(((self.VERSION, sys.version_info[0]), self.entries), f, 2),
+                                 "wb")
+            self.modified = False
 
 class DoxyMLParser:
-    def __init__(self, verbose = False):
+    def __init__(self, verbose = False, cache = None):
         self.classes = []
         self.verbose = verbose
 
-    def find_class(self, name):
-        for aclass in self.classes:
-            if aclass.name == name:
-                return aclass
+        # the cache of the parsed files, if the name of the file to store it
+        # in is given
+        self.cache = None
+        if cache:
+            self.cache = ParseCache(cache)
 
-        return None
+        # index of the classes by name, containing the first class with the
+        # given name if there are several of them
+        self.class_index = {}
 
-    def get_enums_and_functions(self, filename, aclass):
-        file_path = os.path.dirname(filename)
-        enum_filename = os.path.join(file_path, aclass.name[2:] + "_8h.xml")
-        if os.path.exists(enum_filename):
-            root = minidom.parse(enum_filename).documentElement
-            for method in root.getElementsByTagName("memberdef"):
-                if method.getAttribute("kind") == "enum":
-                    self.parse_enum(aclass, method, root)
+        # cache of the inheritance chains indexed by the class name, see
+        # get_base_chain()
+        self.base_chains = {}
 
-    def is_derived_from_base(self, aclass, abase):
-        base = get_first_value(aclass.bases)
-        while base and base != "":
+        # maps the compound ids of the headers containing any enums, which
+        # encode their full paths, e.g. "ribbon_2panel_8h", to their XML
+        # files, only used when parsing index.xml, see parse_index()
+        self.header_files = None
 
-            if base == abase:
-                return True
+        # the enums parsed from each header XML file during this run, see
+        # get_enums()
+        self.file_enums = {}
 
-            parentclass = self.find_class(base)
+        # descriptions indexed by the ids of the elements containing them and
+        # their tags, as the same members can occur several times, see
+        # get_doc()
+        self.docs = {}
 
-            if parentclass:
-                base = get_first_value(parentclass.bases)
-            else:
-                base = None
+    def add_classes(self, classes):
+        for aclass in classes:
+            self.classes.append(aclass)
+            self.class_index.setdefault(aclass.name, aclass)
 
-        return False
+        # the chains could have changed if any of the new classes is a base
+        self.base_chains = {}
 
-    def parse(self, filename):
-        self.xmldoc = minidom.parse(filename).documentElement
-        for node in self.xmldoc.getElementsByTagName("compounddef"):
-            new_class = self.parse_class(node)
-            self.classes.append(new_class)
-            self.get_enums_and_functions(filename, new_class)
+    def save_cache(self):
+        if self.cache:
+            self.cache.save()
 
-    def parse_class(self, class_node):
+    def find_class(self, name):
+        return self.class_index.get(name)
+
+    def get_enums_and_functions(self, filename, aclass):
+        # the enums are taken from the header with the same name as the class,
+        # e.g. wx/window.h for wxWindow, and not from the header it is
+        # declared in, as the latter can declare several classes
+        header_id = aclass.name[2:].lower() + "_8h"
+        if self.header_files is not None:
+            # we already know which headers have any enums
+            enum_filename = self.header_files.get(header_id)
+            if enum_filename is None:
+                return
+        else:
+            file_path = os.path.dirname(filename)
+            enum_filename = os.path.join(file_path, header_id + ".xml")
+            if not os.path.exists(enum_filename):
+                return
+
+        for enum_name, enum_values in self.get_enums(enum_filename):
+            aclass.enums[enum_name] = enum_values
+
+    def get_enums(self, filename):
+        """
+        Return the list of (name, values) pairs for all the enums in the
+        given file, using the cache if possible.
+        """
+        enums = self.file_enums.get(filename)
+        if enums is not None:
+            return enums
+
+        if self.cache:
+            enums = self.cache.get(filename)
+
+        if enums is None:
+            enums = []
+            for method, parent in iterElements(filename):
+                if method.tag == "memberdef" and method.get("kind") == "enum":
+                    enums.append(self.parse_enum(method))
+
+            if self.cache:
+                self.cache.put(filename, enums)
+
+        self.file_enums[filename] = enums
+        return enums
+
+    def get_name_chain(self, name):
+        """
+        Return the tuple containing the given class name followed by the names
+        of all its bases, using only the first base of each class, and the
+        frozenset of the same names.
+        """
+        chain = self.base_chains.get(name)
+        if chain is None:
+            names = []
+            seen = set()
+            while name and name not in seen:
+                names.append(name)
+                seen.add(name)
+                cached = self.base_chains.get(name)
+                if cached is not None:
+                    names.extend(cached[0][1:])
+                    break
+
+                parentclass = self.find_class(name)
+                if parentclass:
+                    name = get_first_value(parentclass.bases)
+                else:
+                    name = None
+
+            chain = (tuple(names), frozenset(names))
+            self.base_chains[names[0]] = chain
+
+        return chain
+
+    def get_base_chain(self, aclass):
+        """
+        Return the tuple of the names of all the bases of the given class
+        starting with its direct first base and ending with the root one.
+        """
+        base = get_first_value(aclass.bases)
+        if not base:
+            return ()
+
+        return self.get_name_chain(base)[0]
+
+    def is_derived_from_base(self, aclass, abase):
+        base = get_first_value(aclass.bases)
+        if not base:
+            return False
+
+        return abase in self.get_name_chain(base)[1]
+
+    def parse(self, filename):
+        self.parse_files([filename])
+
+    def parse_index(self, filename, jobs=1):
+        """
+        Parse all the wx classes listed in the given Doxygen index.xml file.
+
+        Only the XML files of the classes and the files of the headers
+        containing any enums are parsed, all the other ones are not even
+        accessed.
+        """
+        xml_dir = os.path.dirname(filename)
+        class_files = []
+        self.header_files = {}
+        for compound, parent in iterElements(filename, ("doxygenindex",)):
+            kind = compound.get("kind")
+            if kind == "class":
+                if getTextValue(compound.find("name")).startswith("wx"):
+                    class_files.append(os.path.join(xml_dir, compound.get("refid") + ".xml"))
+            elif kind == "file":
+                # notice that the file names are not unique, e.g. there are
+                # both wx/panel.h and wx/ribbon/panel.h, so use the ids
+                for member in compound.findall("member"):
+                    if member.get("kind") == "enum":
+                        refid = compound.get("refid")
+                        self.header_files[refid] = os.path.join(xml_dir, refid + ".xml")
+                        break
+
+        # use the same order as when the files are given on the command line
+        self.parse_files(sorted(class_files), jobs)
+
+    def parse_files(self, filenames, jobs=1):
+        """
+        Parse all the given files, using the given number of processes.
+
+        The files found in the cache, if any, are not parsed again. The
+        classes are always added in the order of the files, so the result is
+        the same as when parsing them one by one.
+        """
+        results = [None] * len(filenames)
+        if self.cache:
+            for i, filename in enumerate(filenames):
+                results[i] = self.cache.get(filename)
+
+        missing = [i for i, classes in enumerate(results) if classes is None]
+        parsed = self.parse_class_files([filenames[i] for i in missing], jobs)
+        for i, classes in zip(missing, parsed):
+            if self.cache:
+                self.cache.put(filenames[i], classes)
+            results[i] = classes
+
+        for filename, classes in zip(filenames, results):
+            for aclass in classes:
+                self.get_enums_and_functions(filename, aclass)
+            self.add_classes(classes)
+
+    def parse_class_files(self, filenames, jobs=1):
+        """
+        Parse the given files without using the cache and return the list of
+        classes defined in each of them.
+        """
+        if jobs > 1 and len(filenames) > 1:
+            pool = multiprocessing.Pool(min(jobs, len(filenames)))
+            try:
+                return pool.map(parseClasses,
+                                [(filename, self.verbose) for filename in filenames],
+                                chunksize=max(1, len(filenames) // (jobs * 4)))
+            finally:
+                pool.close()
+                pool.join()
+
+        return [self.parse_classes(filename) for filename in filenames]
+
+    def parse_classes(self, filename):
+        # The class is built incrementally: its name comes before all of its
+        # members in Doxygen output, so each member can be added to it as soon
+        # as it is parsed, while the class itself is complete only once the
+        # compounddef element ends.
+        #
+        # Notice that the enums are not filled in here, this is done by
+        # get_enums_and_functions() separately.
+        classes = []
         new_class = ClassDefinition()
-        new_class.name = getTextValue(class_node.getElementsByTagName("compoundname")[0])
-        for node in class_node.childNodes:
-            if node.nodeName == "basecompoundref":
-                new_class.bases.append(getTextValue(node))
-            elif node.nodeName == "briefdescription":
-                # let the post-processor determ
-                new_class.brief_description = node.toxml()
-            elif node.nodeName == "detaileddescription":
-                new_class.detailed_description = node.toxml()
-            elif node.nodeName == "includes":
-                new_class.includes.append(getTextValue(node))
-
-        self.parse_methods(new_class, class_node)
-
-        return new_class
-
-    def parse_enum(self, new_class, enum, root):
+        for node, parent in iterElements(filename):
+            if node.tag == "memberdef":
+                self.add_method(new_class, self.parse_method(node))
+            elif parent.tag == "compounddef":
+                self.parse_class_child(new_class, node, parent.get("id"))
+            elif node.tag == "compounddef":
+                classes.append(new_class)
+                new_class = ClassDefinition()
+
+        return classes
+
+    def get_doc(self, owner_id, node):
+        """
+        Return DocText for the description node of the element with the given
+        id, reusing the already parsed one if any.
+        """
+        key = (owner_id, node.tag)
+        doc = self.docs.get(key)
+        if doc is None:
+            doc = parseDoc(node)
+            if owner_id is not None:
+                self.docs[key] = doc
+        return doc
+
+    def parse_class_child(self, new_class, node, class_id=None):
+        if node.tag == "compoundname":
+            new_class.name = getTextValue(node)
+        elif node.tag == "basecompoundref":
+            new_class.bases.append(getTextValue(node))
+        elif node.tag == "briefdescription":
+            new_class.brief_doc = self.get_doc(class_id, node)
+            new_class.brief_description = new_class.brief_doc.text
+        elif node.tag == "detaileddescription":
+            new_class.detailed_doc = self.get_doc(class_id, node)
+            new_class.detailed_description = new_class.detailed_doc.text
+        elif node.tag == "includes":
+            new_class.includes.append(getTextValue(node))
+
+    def parse_enum(self, enum):
         enum_name = ""
         enum_values = []
 
-        for node in enum.childNodes:
-            if node.nodeName == "name":
+        for node in enum:
+            if node.tag == "name":
                 enum_name = getTextValue(node)
-            elif node.nodeName == "enumvalue":
-                enum_values.append(getTextValue(node.getElementsByTagName("name")[0]))
-
-        new_class.enums[enum_name] = enum_values
-
-    def parse_methods(self, new_class, root):
-        for method in root.getElementsByTagName("memberdef"):
-            new_method = MethodDefinition()
-            for node in method.childNodes:
-                if node.nodeName == "name":
-                    new_method.name = getTextValue(node)
-                elif node.nodeName == "type":
-                    new_method.return_type = getTextValue(node)
-                elif node.nodeName == "definition":
-                    new_method.definition = getTextValue(node)
-                elif node.nodeName == "argsstring":
-                    new_method.argsstring = getTextValue(node)
-                elif node.nodeName == "param":
-                    param = {}
-                    for child in node.childNodes:
-                        if child.nodeType == child.ELEMENT_NODE:
-                            param[child.nodeName] = getTextValue(child)
-                    new_method.params.append(param)
-
+            elif node.tag == "enumvalue":
+                enum_values.append(getTextValue(node.find(".//name")))
+
+        return enum_name, enum_values
+
+    def parse_method(self, method):
+        new_method = MethodDefinition()
+        new_method.is_const = method.get("const") == "yes"
+        method_id = method.get("id")
+        for node in method:
+            if node.tag == "name":
+                new_method.name = getTextValue(node)
+            elif node.tag == "type":
+                new_method.return_type = getTextValue(node)
+            elif node.tag == "definition":
+                new_method.definition = getTextValue(node)
+            elif node.tag == "argsstring":
+                new_method.argsstring = getTextValue(node)
+            elif node.tag == "briefdescription":
+                new_method.brief_doc = self.get_doc(method_id, node)
+                new_method.brief_description = new_method.brief_doc.text
+            elif node.tag == "detaileddescription":
+                new_method.detailed_doc = self.get_doc(method_id, node)
+                new_method.detailed_description = new_method.detailed_doc.text
+            elif node.tag == "param":
+                param = {}
+                for child in node:
+                    param[child.tag] = getTextValue(child)
+                new_method.params.append(param)
+
+        if self.verbose:
+            print("Adding %s" % (new_method.name + new_method.argsstring))
+
+        return new_method
+
+    def add_method(self, new_class, new_method):
+        # Doxygen may output the same method more than once, e.g. if it's
+        # documented in several places, only keep the first occurrence
+        if not new_class.add_to_index(new_method):
             if self.verbose:
-                print "Adding %s" % (new_method.name + new_method.argsstring)
+                print("Skipping duplicate %s" % (new_method.name + new_method.argsstring))
+            return
+
+        if new_method.name == new_class.name:
+            new_class.constructors.append(new_method)
+        elif new_method.name == "~" + new_class.name:
+            new_class.destructors.append(new_method)
+        else:
+            new_class.methods.append(new_method)
 
-            if new_method.name == new_class.name:
-                new_class.constructors.append(new_method)
-            elif new_method.name == "~" + new_class.name:
-                new_class.destructors.append(new_method)
-            else:
-                new_class.methods.append(new_method)
+def parseClasses(args):
+    # This is used by DoxyMLParser.parse_files() in the worker processes.
+    filename, verbose = args
+    return DoxyMLParser(verbose = verbose).parse_classes(filename)
 
 if __name__ == "__main__":
     option_dict = {
                 "report"        : (False, "Print out the classes and methods found by this script."),
                 "verbose"       : (False, "Provide status updates and other information."),
+                "cache"         : ("", "File to cache the parsed data in to avoid parsing the unchanged files again."),
+                "index"         : ("", "Doxygen index.xml file to parse all the classes listed in it instead of the given files."),
               }
 
     parser = optparse.OptionParser(usage="usage: %prog [options] <doxyml files to parse>\n" + __description__, version="%prog 1.0")
@@ -210,21 +738,27 @@ if __name__ == "__main__":
         default = option_dict[opt][0]
 
         action = "store"
-        if type(default) == types.BooleanType:
+        if isinstance(default, bool):
             action = "store_true"
         parser.add_option("--" + opt, default=default, action=action, dest=opt, help=option_dict[opt][1])
 
     options, arguments = parser.parse_args()
 
-    if len(arguments) < 1:
+    if len(arguments) < 1 and not options.index:
         parser.print_usage()
         sys.exit(1)
 
-    doxyparse = DoxyMLParser(verbose = options.verbose)
-    for arg in arguments:
-        doxyparse.parse(arg)
+    # use the classes from the module and not from __main__ for them to be
+    # found when unpickling the cached data in the other scripts
+    import doxymlparser
+
+    doxyparse = doxymlparser.DoxyMLParser(verbose = options.verbose, cache = options.cache)
+    if options.index:
+        doxyparse.parse_index(options.index)
+    doxyparse.parse_files(arguments)
+    doxyparse.save_cache()
 
     if options.report:
         for aclass in doxyparse.classes:
-            print str(aclass)
+            print(str(aclass))
 
@@ -1,8 +1,9 @@
+from __future__ import print_function
+
 import optparse
 import sys
-import os
-import string
-import types
+
+from multiprocessing.pool import ThreadPool
 
 import c_tools
 import doxymlparser
@@ -11,43 +12,91 @@ import swig_tools
 
 from common import *
 
+def make_bindings(doxyparse, builders, threads=1, prune=False):
+    """
+    Generate the bindings for all the classes using all the given builders.
+
+    The data shared by all the builders is computed only once for each class
+    and then each class is processed by all the builders, either one after
+    another or, if more than one thread is used, in parallel. Each builder
+    always processes the classes in the same order, so the results are the
+    same in both cases.
+
+    The previously generated files of the classes which were not parsed are
+    only removed if prune is true.
+    """
+    for builder in builders:
+        builder.begin(prune)
+
+    infos = (ClassInfo(doxyparse, aclass) for aclass in doxyparse.classes)
+    if threads > 1 and len(builders) > 1:
+        infos = list(infos)
+
+        def make_classes(builder):
+            for info in infos:
+                builder.make_class(info)
+
+        pool = ThreadPool(min(threads, len(builders)))
+        try:
+            pool.map(make_classes, builders)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for info in infos:
+            for builder in builders:
+                builder.make_class(info)
+
+    for builder in builders:
+        builder.end()
+
 if __name__ == "__main__":
     option_dict = {
                 "output_dir"     : ("output", "Directory to output bindings to"),
                 "sip"            : (True, "Produce SIP bindings"),
                 "swig"           : (True, "Produce SWIG bindings."),
                 "c"              : (True, "Produce C wrappers."),
+                "jobs"           : (1, "Number of processes to use for parsing the XML files."),
+                "cache"          : ("", "File to cache the parsed data in to avoid parsing the unchanged files again."),
+                "threads"        : (1, "Number of threads to use for generating the different kinds of bindings."),
+                "index"          : ("", "Doxygen index.xml file to generate bindings for all the classes listed in it."),
+                "prune"          : (False, "Remove the previously generated bindings for all the classes not parsed now, always done with --index."),
 
     }
 
-    parser = optparse.OptionParser(usage="usage: %prog <doxyml files to parse>\n" , version="%prog 1.0")
+    parser = optparse.OptionParser(usage="usage: %prog <doxyml files to parse>\n       %prog --index=out/xml/index.xml\n" , version="%prog 1.0")
 
     for opt in option_dict:
         default = option_dict[opt][0]
 
         action = "store"
-        if type(default) == types.BooleanType:
+        opttype = None
+        if isinstance(default, bool):
             action = "store_true"
-        parser.add_option("--" + opt, default=default, action=action, dest=opt, help=option_dict[opt][1])
+        elif isinstance(default, int):
+            opttype = "int"
+        parser.add_option("--" + opt, default=default, action=action, type=opttype, dest=opt, help=option_dict[opt][1])
 
     options, arguments = parser.parse_args()
 
-    if len(arguments) < 1:
+    if len(arguments) < 1 and not options.index:
         parser.print_usage()
         sys.exit(1)
 
-    doxyparse = doxymlparser.DoxyMLParser()
-    for arg in arguments:
-        doxyparse.parse(arg)
+    doxyparse = doxymlparser.DoxyMLParser(cache = options.cache)
+    if options.index:
+        doxyparse.parse_index(options.index, options.jobs)
+    doxyparse.parse_files(arguments, options.jobs)
+    doxyparse.save_cache()
 
+    builders = []
     if options.sip:
-        builder = sip_tools.SIPBuilder(doxyparse, options.output_dir)
-        builder.make_bindings()
+        builders.append(sip_tools.SIPBuilder(doxyparse, options.output_dir))
 
     if options.swig:
-        builder = swig_tools.SWIGBuilder(doxyparse, options.output_dir)
-        builder.make_bindings()
+        builders.append(swig_tools.SWIGBuilder(doxyparse, options.output_dir))
 
     if options.c:
-        builder = c_tools.CBuilder(doxyparse, options.output_dir)
-        builder.make_bindings()
+        builders.append(c_tools.CBuilder(doxyparse, options.output_dir))
+
+    make_bindings(doxyparse, builders, options.threads, options.prune or bool(options.index))
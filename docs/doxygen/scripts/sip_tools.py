@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import os
 
 from common import *
@@ -8,24 +10,32 @@ class SIPBuilder:
         self.output_dir = outputdir
 
     def make_bindings(self):
+        self.begin()
+        for aclass in self.doxyparser.classes:
+            self.make_class(ClassInfo(self.doxyparser, aclass))
+        self.end()
+
+    def begin(self, prune=False):
         output_dir = os.path.abspath(os.path.join(self.output_dir, "sip"))
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        for aclass in self.doxyparser.classes:
-            if aclass.name in excluded_classes:
-                print "Skipping %s" % aclass.name
-                continue
+        self.manifest = OutputManifest(output_dir, prune=prune)
+
+    def make_class(self, info):
+        if info.excluded:
+            print("Skipping %s" % info.name)
+            return
 
-            header_name = aclass.name[2:].lower()
-            filename = os.path.join(output_dir, "_" + header_name + ".sip")
-            enums_text = make_enums(aclass)
-            method_text = self.make_sip_methods(aclass)
-            base_class = get_first_value(aclass.bases)
-            if base_class != "":
-                base_class = ": %s" % base_class
+        filename = os.path.join(self.manifest.output_dir, "_" + info.header_name + ".sip")
+        self.manifest.write_file(info.name, filename, self.iter_sip_class(info))
 
-            text = """
+    def iter_sip_class(self, info):
+        base_class = info.base
+        if base_class != "":
+            base_class = ": %s" % base_class
+
+        yield """
 %s
 class %s %s
 {
@@ -34,51 +44,44 @@ class %s %s
 %%End
 
 public:
-%s
+""" % (info.enums_text, info.name, base_class, info.include)
+
+        for fragment in self.iter_sip_methods(info.aclass, info.is_window):
+            yield fragment
+
+        yield """
 };
-""" % (enums_text, aclass.name, base_class, get_first_value(aclass.includes), method_text)
+"""
+
+    def end(self):
+        self.manifest.save([aclass.name for aclass in self.doxyparser.classes])
+
 
-            afile = open(filename, "wb")
-            afile.write(text)
-            afile.close()
+    def make_sip_methods(self, aclass, is_window=None):
+        return "".join(self.iter_sip_methods(aclass, is_window))
 
+    def iter_sip_methods(self, aclass, is_window=None):
+        # We need to let SIP know when wx is responsible for deleting the object.
+        # We do this if the class is derived from wxWindow, since wxTLW manages child windows
+        # and wxApp deletes all wxTLWs on shutdown
+        if is_window is None:
+            is_window = self.doxyparser.is_derived_from_base(aclass, "wxWindow")
 
-    def make_sip_methods(self, aclass):
-        retval = ""
+        ctor_transfer = ""
+        if is_window:
+            ctor_transfer = "/Transfer/"
 
-        for amethod in aclass.constructors + aclass.methods:
+        num_ctors = len(aclass.constructors)
+        for index, amethod in enumerate(aclass.constructors + aclass.methods):
             transfer = ""
 
-            # FIXME: we need to come up with a way of filtering the methods out by various criteria
-            # including parameters and method name, and how to deal with overloads
-            if aclass.name in ignored_methods:
-                should_ignore = False
-                for method in ignored_methods[aclass.name]:
-                    print "method = %s" % method
-                    if method == amethod.name:
-                        params = ignored_methods[aclass.name][method]
-                        should_ignore = True
-                        for i in xrange(len(params)):
-                            if i >= len(amethod.params):
-                                should_ignore = False
-                                break
-                            elif amethod.params[i]["type"] != params[i]:
-                                print "param type = %s, amethod.param type = %s" % (params[i], amethod.params[i]["type"])
-                                should_ignore = False
-                                break
-
-                if should_ignore:
-                    continue
-
-            # We need to let SIP know when wx is responsible for deleting the object.
-            # We do this if the class is derived from wxWindow, since wxTLW manages child windows
-            # and wxApp deletes all wxTLWs on shutdown
-            if amethod in aclass.constructors and self.doxyparser.is_derived_from_base(aclass, "wxWindow"):
-                transfer = "/Transfer/"
+            if ignored_methods_filter.matches(aclass.name, amethod):
+                continue
+
+            if index < num_ctors:
+                transfer = ctor_transfer
 
             if amethod.name.startswith("operator"):
                 continue
 
-            retval += "    %s %s%s%s;\n\n" % (amethod.return_type.replace("virtual ", ""), amethod.name, amethod.argsstring, transfer)
-
-        return retval
+            yield "    %s %s%s%s;\n\n" % (amethod.return_type.replace("virtual ", ""), amethod.name, amethod.argsstring, transfer)
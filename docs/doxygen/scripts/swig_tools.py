@@ -8,20 +8,28 @@ class SWIGBuilder:
         self.output_dir = outputdir
 
     def make_bindings(self):
+        self.begin()
+        for aclass in self.doxyparser.classes:
+            self.make_class(ClassInfo(self.doxyparser, aclass))
+        self.end()
+
+    def begin(self, prune=False):
         output_dir = os.path.abspath(os.path.join(self.output_dir, "swig"))
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        for aclass in self.doxyparser.classes:
-            header_name = aclass.name[2:].lower()
-            if aclass.name in excluded_classes:
-                #print "Skipping %s" % aclass.name
-                continue
-
-            filename = os.path.join(output_dir, "_" + header_name + ".i")
-            enums_text = make_enums(aclass)
-            method_text = self.make_swig_methods(aclass)
-            text = """
+        self.manifest = OutputManifest(output_dir, prune=prune)
+
+    def make_class(self, info):
+        if info.excluded:
+            #print("Skipping %s" % info.name)
+            return
+
+        filename = os.path.join(self.manifest.output_dir, "_" + info.header_name + ".i")
+        self.manifest.write_file(info.name, filename, self.iter_swig_class(info))
+
+    def iter_swig_class(self, info):
+        yield """
 %%newgroup
 
 %s
@@ -29,33 +37,36 @@ class %s : publib %s
 {
 
 public:
-%s
+""" % (info.enums_text, info.name, info.base)
+
+        for fragment in self.iter_swig_methods(info.aclass):
+            yield fragment
+
+        yield """
 };
-""" % (enums_text, aclass.name, get_first_value(aclass.bases), method_text)
+"""
 
-            afile = open(filename, "wb")
-            afile.write(text)
-            afile.close()
+    def end(self):
+        self.manifest.save([aclass.name for aclass in self.doxyparser.classes])
 
 
     def make_swig_methods(self, aclass):
-        retval = ""
+        return "".join(self.iter_swig_methods(aclass))
 
-        retval += """
+    def iter_swig_methods(self, aclass):
+        yield """
     %%pythonAppend %s    "self._setOORInfo(self)"
     %%pythonAppend %s() ""
     %%typemap(out) %s*; // turn off this typemap
     """ % (aclass.name, aclass.name, aclass.name)
 
         for amethod in aclass.constructors:
-            retval += "    %s%s;\n\n" % (amethod.name, amethod.argsstring)
+            yield "    %s%s;\n\n" % (amethod.name, amethod.argsstring)
 
-        retval += """
+        yield """
         // Turn it back on again
         %%typemap(out) %s* { $result = wxPyMake_wxObject($1, $owner); }
     """ % aclass.name
 
         for amethod in aclass.methods:
-            retval += "    %s %s%s;\n\n" % (amethod.return_type, amethod.name, amethod.argsstring)
-
-        return retval
+            yield "    %s %s%s;\n\n" % (amethod.return_type, amethod.name, amethod.argsstring)
@@ -0,0 +1,14 @@
+
+// Enums
+
+
+
+// 
+wxCAnybutton* wxCAnybutton_wxAnyButton();
+
+
+
+// Return the bitmap.
+wxBitmap wxCAnybutton_GetBitmap(wxCAnybutton* obj);
+
+
@@ -0,0 +1,18 @@
+
+// Enums
+
+
+
+// Constructor.
+wxCButton* wxCButton_wxButton(wxWindow *parent, wxWindowID id, const wxString &label=wxEmptyString);
+
+
+
+// Returns true if an authentication needed symbol is displayed.
+bool wxCButton_GetAuthNeeded(wxCButton* obj);
+
+
+// Returns the default size.
+static wxSize wxCButton_GetDefaultSize(wxCButton* obj);
+
+
@@ -0,0 +1,28 @@
+
+// Enums
+enum wxEllipsizeFlags {
+    wxELLIPSIZE_FLAGS_NONE, 
+    wxELLIPSIZE_FLAGS_DEFAULT
+};
+
+
+
+
+// Constructs a control.
+wxCControl* wxCControl_wxControl(wxWindow *parent, wxWindowID id);
+
+
+
+// Default constructor.
+wxCControl* wxCControl_wxControl();
+
+
+
+// Returns the control label.
+wxString wxCControl_GetLabel(wxCControl* obj);
+
+
+// Sets the label.
+virtual void wxCControl_SetLabel(wxCControl* obj, const wxString &label);
+
+
@@ -0,0 +1,28 @@
+
+// Enums
+enum wxIconLoc {
+    wxICON_LOC_NONE
+};
+
+
+
+
+// Default ctor.
+wxCIcon* wxCIcon_wxIcon();
+
+
+
+// Creates an icon from an array of bits.
+wxCIcon* wxCIcon_wxIcon(const char bits[], int width, int height);
+
+
+
+// Creates a bitmap from XPM data.
+wxCIcon* wxCIcon_wxIcon(const char *const *bits);
+
+
+
+// Loads an icon from a file or resource.
+bool wxCIcon_LoadFile(wxCIcon* obj, const wxString &name, wxBitmapType type=wxICON_DEFAULT_TYPE, int desiredWidth=-1, int desiredHeight=-1);
+
+
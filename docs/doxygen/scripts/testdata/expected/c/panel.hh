@@ -0,0 +1,14 @@
+
+// Enums
+
+
+
+// Default constructor.
+wxCPanel* wxCPanel_wxPanel();
+
+
+
+// Sends a wxEVT_INIT_DIALOG event.
+void wxCPanel_InitDialog(wxCPanel* obj);
+
+
@@ -0,0 +1,23 @@
+
+// Enums
+
+
+
+// Constructs a point.
+wxCPoint* wxCPoint_wxPoint();
+
+
+
+// Initializes the point.
+wxCPoint* wxCPoint_wxPoint(int x, int y);
+
+
+
+// 
+wxPoint& wxCPoint_operator+=(wxCPoint* obj, const wxPoint &pt);
+
+
+// x member.
+int wxCPoint_x(wxCPoint* obj, ;
+
+
@@ -0,0 +1,14 @@
+
+// Enums
+
+
+
+// Creates a size object.
+wxCSize* wxCSize_wxSize(int width, int height);
+
+
+
+// Gets the width member.
+int wxCSize_GetWidth(wxCSize* obj);
+
+
@@ -0,0 +1,54 @@
+
+// Enums
+enum wxShowEffect {
+    wxSHOW_EFFECT_NONE, 
+    wxSHOW_EFFECT_ROLL_TO_LEFT, 
+    wxSHOW_EFFECT_MAX
+};
+
+enum wxWindowVariant {
+    wxWINDOW_VARIANT_NORMAL, 
+    wxWINDOW_VARIANT_SMALL
+};
+
+
+
+
+// Default constructor.
+wxCWindow* wxCWindow_wxWindow();
+
+
+
+// Constructs a window, which can be a child of a frame, dialog or any other non-control window.
+// @param parent Pointer to a parent window.
+wxCWindow* wxCWindow_wxWindow(wxWindow *parent, wxWindowID id, const wxPoint &pos=wxDefaultPosition, const wxSize &size=wxDefaultSize, long style=0, const wxString &name=wxPanelNameStr);
+
+
+
+// Shows or hides the window.
+// You may need to call Raise() for a top level window if you want to bring it to top.
+// @return true if the window has been shown or hidden or false if nothing was done because it already was in the requested state.
+virtual bool wxCWindow_Show(wxCWindow* obj, bool show=true);
+
+
+// Raises the window to the top of the window hierarchy (Z-order).
+// Notice that this function only requests the window manager to raise this window & may be ignored for "modal" windows <sic>.
+virtual void wxCWindow_Raise(wxCWindow* obj);
+
+
+// See the GetSize(int*,int*) overload for more info.
+wxSize wxCWindow_GetSize(wxCWindow* obj);
+
+
+// Returns the size of the entire window in pixels.
+void wxCWindow_GetSize(wxCWindow* obj, int *width, int *height) const;
+
+
+// 
+wxWindow& wxCWindow_operator=(wxCWindow* obj, const wxWindow &other);
+
+
+// Finds the window or control which currently has the keyboard focus.
+static wxWindow* wxCWindow_FindFocus(wxCWindow* obj);
+
+
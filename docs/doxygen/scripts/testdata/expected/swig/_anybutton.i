@@ -0,0 +1,21 @@
+
+%newgroup
+
+
+class wxAnyButton : publib wxControl
+{
+
+public:
+
+    %pythonAppend wxAnyButton    "self._setOORInfo(self)"
+    %pythonAppend wxAnyButton() ""
+    %typemap(out) wxAnyButton*; // turn off this typemap
+        wxAnyButton();
+
+
+        // Turn it back on again
+        %typemap(out) wxAnyButton* { $result = wxPyMake_wxObject($1, $owner); }
+        wxBitmap GetBitmap() const;
+
+
+};
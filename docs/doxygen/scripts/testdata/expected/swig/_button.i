@@ -0,0 +1,23 @@
+
+%newgroup
+
+
+class wxButton : publib wxAnyButton
+{
+
+public:
+
+    %pythonAppend wxButton    "self._setOORInfo(self)"
+    %pythonAppend wxButton() ""
+    %typemap(out) wxButton*; // turn off this typemap
+        wxButton(wxWindow *parent, wxWindowID id, const wxString &label=wxEmptyString);
+
+
+        // Turn it back on again
+        %typemap(out) wxButton* { $result = wxPyMake_wxObject($1, $owner); }
+        bool GetAuthNeeded() const;
+
+    static wxSize GetDefaultSize();
+
+
+};
@@ -0,0 +1,30 @@
+
+%newgroup
+
+enum wxEllipsizeFlags {
+    wxELLIPSIZE_FLAGS_NONE, 
+    wxELLIPSIZE_FLAGS_DEFAULT
+};
+
+
+class wxControl : publib wxWindow
+{
+
+public:
+
+    %pythonAppend wxControl    "self._setOORInfo(self)"
+    %pythonAppend wxControl() ""
+    %typemap(out) wxControl*; // turn off this typemap
+        wxControl(wxWindow *parent, wxWindowID id);
+
+    wxControl();
+
+
+        // Turn it back on again
+        %typemap(out) wxControl* { $result = wxPyMake_wxObject($1, $owner); }
+        wxString GetLabel() const;
+
+    virtual void SetLabel(const wxString &label);
+
+
+};
@@ -0,0 +1,29 @@
+
+%newgroup
+
+enum wxIconLoc {
+    wxICON_LOC_NONE
+};
+
+
+class wxIcon : publib wxGDIObject
+{
+
+public:
+
+    %pythonAppend wxIcon    "self._setOORInfo(self)"
+    %pythonAppend wxIcon() ""
+    %typemap(out) wxIcon*; // turn off this typemap
+        wxIcon();
+
+    wxIcon(const char bits[], int width, int height);
+
+    wxIcon(const char *const *bits);
+
+
+        // Turn it back on again
+        %typemap(out) wxIcon* { $result = wxPyMake_wxObject($1, $owner); }
+        bool LoadFile(const wxString &name, wxBitmapType type=wxICON_DEFAULT_TYPE, int desiredWidth=-1, int desiredHeight=-1);
+
+
+};
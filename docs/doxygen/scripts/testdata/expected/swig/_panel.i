@@ -0,0 +1,21 @@
+
+%newgroup
+
+
+class wxPanel : publib wxWindow
+{
+
+public:
+
+    %pythonAppend wxPanel    "self._setOORInfo(self)"
+    %pythonAppend wxPanel() ""
+    %typemap(out) wxPanel*; // turn off this typemap
+        wxPanel();
+
+
+        // Turn it back on again
+        %typemap(out) wxPanel* { $result = wxPyMake_wxObject($1, $owner); }
+        void InitDialog();
+
+
+};
@@ -0,0 +1,25 @@
+
+%newgroup
+
+
+class wxPoint : publib 
+{
+
+public:
+
+    %pythonAppend wxPoint    "self._setOORInfo(self)"
+    %pythonAppend wxPoint() ""
+    %typemap(out) wxPoint*; // turn off this typemap
+        wxPoint();
+
+    wxPoint(int x, int y);
+
+
+        // Turn it back on again
+        %typemap(out) wxPoint* { $result = wxPyMake_wxObject($1, $owner); }
+        wxPoint& operator+=(const wxPoint &pt);
+
+    int x;
+
+
+};
@@ -0,0 +1,21 @@
+
+%newgroup
+
+
+class wxSize : publib 
+{
+
+public:
+
+    %pythonAppend wxSize    "self._setOORInfo(self)"
+    %pythonAppend wxSize() ""
+    %typemap(out) wxSize*; // turn off this typemap
+        wxSize(int width, int height);
+
+
+        // Turn it back on again
+        %typemap(out) wxSize* { $result = wxPyMake_wxObject($1, $owner); }
+        int GetWidth();
+
+
+};
@@ -0,0 +1,46 @@
+
+%newgroup
+
+enum wxShowEffect {
+    wxSHOW_EFFECT_NONE, 
+    wxSHOW_EFFECT_ROLL_TO_LEFT, 
+    wxSHOW_EFFECT_MAX
+};
+
+enum wxWindowVariant {
+    wxWINDOW_VARIANT_NORMAL, 
+    wxWINDOW_VARIANT_SMALL
+};
+
+
+class wxWindow : publib wxEvtHandler
+{
+
+public:
+
+    %pythonAppend wxWindow    "self._setOORInfo(self)"
+    %pythonAppend wxWindow() ""
+    %typemap(out) wxWindow*; // turn off this typemap
+        wxWindow();
+
+    wxWindow(wxWindow *parent, wxWindowID id, const wxPoint &pos=wxDefaultPosition, const wxSize &size=wxDefaultSize, long style=0, const wxString &name=wxPanelNameStr);
+
+
+        // Turn it back on again
+        %typemap(out) wxWindow* { $result = wxPyMake_wxObject($1, $owner); }
+        virtual bool Show(bool show=true);
+
+    virtual void Raise();
+
+    wxSize GetSize() const;
+
+    void GetSize(int *width, int *height) const;
+
+    wxWindow& operator=(const wxWindow &other);
+
+    static wxWindow* FindFocus();
+
+    int m_windowId;
+
+
+};
@@ -10,6 +10,15 @@ import os
 import string
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'build', 'tools'))
+from write_if_changed import writeIfChanged
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 def ReadTable():
     table = []
     try:
@@ -135,10 +144,11 @@ def ReplaceGeneratedPartOfFile(fname, func):
         fname is the name of the input file and func must be a function taking
         a file and language table on input and writing the appropriate chunk to
         this file, e.g. WriteEnum or WriteTable.
+
+        The file is only modified if its contents really changes.
     """
     fin = open(fname, 'rt')
-    fnameNew = fname + '.new'
-    fout = open(fnameNew, 'wt')
+    fout = StringIO()
     betweenBeginAndEnd = 0
     afterEnd = 0
     for l in fin.readlines():
@@ -159,13 +169,13 @@ def ReplaceGeneratedPartOfFile(fname, func):
         if not betweenBeginAndEnd:
             fout.write(l)
 
+    fin.close()
+
     if not afterEnd:
         print 'Failed to process %s.' % fname
-        os.remove(fnameNew)
         sys.exit(1)
 
-    os.remove(fname)
-    os.rename(fnameNew, fname)
+    writeIfChanged(fname, fout.getvalue(), 'wt')
 
 table = ReadTable()
 ReplaceGeneratedPartOfFile('include/wx/language.h', WriteEnum)
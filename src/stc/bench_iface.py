@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+#----------------------------------------------------------------------------
+# Name:         src/stc/bench_iface.py
+# Purpose:      Benchmark for the different stages of gen_iface.py.
+# Author:       wxWidgets development team
+# Created:      2026-10-17
+# Copyright:    (c) 2026 wxWidgets development team
+# Licence:      wxWindows licence
+#----------------------------------------------------------------------------
+
+"""
+Measure the time taken by the different stages of generating the STC sources
+by gen_iface.py, using the real Scintilla.iface and synthetic iface files
+obtained by repeating all its definitions the given number of times.
+
+All the files are created in a temporary directory, the source tree is never
+modified. Example of use:
+
+    python bench_iface.py --scale 1 10 100 --profile gen_iface.prof
+"""
+
+import sys, os, re, shutil, tempfile, argparse
+from timeit import default_timer as timer
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+sys.dont_write_bytecode = True
+import gen_iface
+from gen_docs import buildDocs
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+IFACE   = gen_iface.IFACE
+HDR_SCN = gen_iface.HDR_SCN
+
+TEMPLATES = (('stc.h',           gen_iface.H_TEMPLATE),
+             ('stc.cpp',         gen_iface.CPP_TEMPLATE),
+             ('stc.interface.h', gen_iface.IH_TEMPLATE))
+
+STAGES = ('parse', 'docs', 'methods', 'templates', 'write', 'total')
+
+#----------------------------------------------------------------------------
+
+valRegex = re.compile(r'^(val )(\w+)=', re.MULTILINE)
+funRegex = re.compile(r'^((?:fun|get|set) +\w+ +)(\w+)=(\d+)', re.MULTILINE)
+
+def makeScaledIface(text, scale):
+    """Return the iface text with all its definitions repeated scale times.
+
+    The copies use different names and message numbers, so that they are
+    processed as new values and methods.
+    """
+    copies = [text]
+    for n in range(1, scale):
+        copy = valRegex.sub(lambda m: '%s%s_%d=' % (m.group(1), m.group(2), n),
+                            text)
+        copy = funRegex.sub(lambda m: '%s%s%d=%d' % (m.group(1), m.group(2), n,
+                                                     int(m.group(3)) + 100000*n),
+                            copy)
+        copies.append(copy)
+    return '\n'.join(copies)
+
+#----------------------------------------------------------------------------
+
+def runOnce(iface, outdir):
+    """Run all the stages once and return the time taken by each of them."""
+    times = {}
+
+    start = timer()
+    model = gen_iface.buildModel(iface, HDR_SCN)
+    times['parse'] = timer() - start
+
+    start = timer()
+    for method in model['methods']:
+        buildDocs(method[1], method[5], method[8])
+    times['docs'] = timer() - start
+
+    # this includes the docs lookup timed above, as it can't be separated
+    start = timer()
+    methods = gen_iface.prepareMethods(model['methods'])
+    times['methods'] = timer() - start
+
+    start = timer()
+    sections = gen_iface.makeSections(model['values'], model['cmds'], methods)
+    texts = []
+    for name, template in TEMPLATES:
+        out = StringIO()
+        chunks = gen_iface.compileTemplate(open(template).read())
+        gen_iface.writeTemplate(out, chunks, sections)
+        texts.append((name, out.getvalue()))
+    times['templates'] = timer() - start
+
+    start = timer()
+    for name, text in texts:
+        open(os.path.join(outdir, name), 'w').write(text)
+    times['write'] = timer() - start
+
+    # and finally the entire generation from scratch
+    for name, text in texts:
+        os.remove(os.path.join(outdir, name))
+
+    start = timer()
+    dest = [os.path.join(outdir, name) for name, template in TEMPLATES]
+    gen_iface.processIface(gen_iface.buildModel(iface, HDR_SCN),
+                           TEMPLATES[0][1], TEMPLATES[1][1], TEMPLATES[2][1],
+                           dest[0], dest[1], None, dest[2])
+    times['total'] = timer() - start
+
+    return times, len(model['values']) + len(model['cmds']), len(methods)
+
+
+def measurePeakMemory(iface, outdir):
+    """Return the peak memory used by a single run in KiB or None."""
+    if tracemalloc is not None:
+        tracemalloc.start()
+        runOnce(iface, outdir)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak // 1024
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # this is the peak memory of the whole process and not just this run
+    runOnce(iface, outdir)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def benchmark(scale, repeat, tmpdir, profile=None):
+    iface = os.path.join(tmpdir, 'Scintilla_x%d.iface' % scale)
+    open(iface, 'w').write(makeScaledIface(open(IFACE).read(), scale))
+
+    outdir = os.path.join(tmpdir, 'x%d' % scale)
+    os.mkdir(outdir)
+
+    # the undocumented methods warnings are not interesting here
+    stdout = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        best = None
+        for i in range(repeat):
+            times, numValues, numMethods = runOnce(iface, outdir)
+            if best is None:
+                best = times
+            else:
+                for stage in STAGES:
+                    best[stage] = min(best[stage], times[stage])
+
+        peak = measurePeakMemory(iface, outdir)
+
+        if profile:
+            import cProfile
+            cProfile.runctx('runOnce(iface, outdir)', globals(),
+                            {'iface': iface, 'outdir': outdir},
+                            '%s.x%d' % (profile, scale))
+    finally:
+        sys.stdout = stdout
+
+    print('x%-4d %6d values %6d methods' % (scale, numValues, numMethods))
+    for stage in STAGES:
+        print('    %-10s %9.1f ms' % (stage, best[stage] * 1000))
+    if peak is not None:
+        print('    %-10s %9d KiB' % ('peak mem', peak))
+    if profile:
+        print('    profile written to %s.x%d' % (profile, scale))
+
+#----------------------------------------------------------------------------
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100],
+                        help='how many times to repeat the iface definitions')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs, the best time is reported')
+    parser.add_argument('--profile', metavar='FILE',
+                        help='dump cProfile statistics to FILE.xN')
+    options = parser.parse_args(args[1:])
+
+    tmpdir = tempfile.mkdtemp(prefix='bench_iface')
+    try:
+        for scale in options.scale:
+            benchmark(scale, options.repeat, tmpdir, options.profile)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
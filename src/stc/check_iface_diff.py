@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+#----------------------------------------------------------------------------
+# Name:         src/stc/check_iface_diff.py
+# Purpose:      Check the report produced by gen_iface.py --diff.
+# Author:       wxWidgets development team
+# Created:      2026-10-17
+# Copyright:    (c) 2026 wxWidgets development team
+# Licence:      wxWindows licence
+#----------------------------------------------------------------------------
+
+"""
+Check that the report produced by "gen_iface.py --diff" for a modified copy
+of Scintilla.iface shows exactly the expected changes.
+
+The outputs generated from the real Scintilla.iface and the modified copy
+are only created in a temporary directory, the source tree is never
+modified.
+"""
+
+import sys, os, shutil, tempfile
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+sys.dont_write_bytecode = True
+import gen_iface
+
+# the changes done to the iface file: the first method passes its message to
+# SendMsg() directly while the second one is overridden and stores it in a
+# "msg" variable first
+IFACE_CHANGES = (('get int GetLength=2006(',
+                  'get int GetLength=2999('),
+                 ('get int GetSubStyleBases=4026(',
+                  'get int GetSubStyleBases=4999('))
+
+EXPECTED_REPORT = [
+    'Values: 0 added, 0 removed, 0 changed',
+    'Methods: 0 added, 0 removed, 2 changed',
+    '~ int GetLength() const [SCI_GETLENGTH]',
+    '  int GetLength() const [2999]',
+    '~ wxString GetSubStyleBases() const [SCI_GETSUBSTYLEBASES]',
+    '  wxString GetSubStyleBases() const [4999]',
+]
+
+
+def makeReport(tmpdir):
+    texts = gen_iface.generate()
+    h_dest = os.path.join(tmpdir, 'stc.h')
+    cpp_dest = os.path.join(tmpdir, 'stc.cpp')
+    for dest, key in ((h_dest, 'h'), (cpp_dest, 'cpp')):
+        f = open(dest, 'w')
+        try:
+            f.write(texts[key])
+        finally:
+            f.close()
+
+    ifaceText = gen_iface.readText(gen_iface.IFACE)
+    for old, new in IFACE_CHANGES:
+        if ifaceText.find(old) == -1:
+            raise ValueError('"%s" not found in the iface file.' % old)
+        ifaceText = ifaceText.replace(old, new)
+
+    model = gen_iface.buildModel(StringIO(ifaceText), gen_iface.HDR_SCN)
+    return gen_iface.makeDiffReport(model,
+                                    h_dest, gen_iface.H_TEMPLATE,
+                                    cpp_dest, gen_iface.CPP_TEMPLATE)
+
+
+def main(args):
+    tmpdir = tempfile.mkdtemp(prefix='check_iface_diff')
+    try:
+        report = makeReport(tmpdir)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    if report != EXPECTED_REPORT:
+        print('Unexpected diff report:')
+        print('\n'.join(report))
+        sys.exit(1)
+
+    print('Diff report is the same as the expected one.')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
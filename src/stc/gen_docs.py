@@ -9,6 +9,9 @@
 # Licence:      wxWindows licence
 #----------------------------------------------------------------------------
 
+import re
+from collections import namedtuple
+
 
 # List of the categories for the documentation.  Tuple items are:
 #
@@ -1417,55 +1420,94 @@ sinceAnnotations= {
 
 #----------------------------------------------------------------------------
 
+# All the information from the maps above is combined into a single record
+# for each method name which is looked up by buildDocs(). Its fields are:
+#
+#         category    the category, always one of those in categoriesList.
+#         docs        the docstring override or None to use the iface one.
+#         substitute  a function applying docSubstitutions to a single line
+#                     or None if there are no substitutions for this method.
+#         docsLong    the extended documentation or 0 for none.
+#         since       the since annotation note or an empty tuple.
+#
+DocRecord = namedtuple('DocRecord',
+                       'category docs substitute docsLong since')
+
+defaultDocRecord = DocRecord('OtherSettings', None, None, 0, ())
+
+def makeSubstitute(substitutions):
+    # longer strings are preferred if several of them match at same position
+    keys = sorted(substitutions, key=len, reverse=True)
+    regex = re.compile('|'.join([re.escape(x) for x in keys]))
+
+    def substitute(line):
+        return regex.sub(lambda m: substitutions[m.group(0)], line)
+    return substitute
+
+def buildDocIndex():
+    categories = frozenset([x for (x,y,z) in categoriesList])
+
+    names = set(docsMap)
+    for m in (docOverrides, docSubstitutions, extendedDocs, sinceAnnotations):
+        names.update(m)
+
+    index = {}
+    for name in names:
+        # If an item does not have a category or the category to which it is
+        # assigned is not in categoriesList, it will be assigned to
+        # 'OtherSettings'
+        category = docsMap.get(name, 'OtherSettings')
+        if category not in categories:
+            category = 'OtherSettings'
+
+        substitute = None
+        if name in docSubstitutions:
+            substitute = makeSubstitute(docSubstitutions[name])
+
+        since = ()
+        if name in sinceAnnotations:
+            since = ('@since '+sinceAnnotations[name],)
+
+        index[name] = DocRecord(category,
+                                docOverrides.get(name),
+                                substitute,
+                                extendedDocs.get(name, 0),
+                                since)
+
+    return index
+
+docIndex = buildDocIndex()
+
+#----------------------------------------------------------------------------
+
+provisionalNote = ('','This method is provisional and is subject to change'
+                   'in future versions of wxStyledTextCtrl.',)
+
 def buildDocs(name, docs, icat):
-    docsLong = 0
-
-    # If an item does not have a category or the category to which it is
-    # assigned is not in categoriesList, it will be assigned to 'OtherSettings'
-    if name in docsMap:
-        category = docsMap[name]
-    else:
-        category = 'OtherSettings'
-
-    if category not in [ x for (x,y,z) in categoriesList]:
-        category = 'OtherSettings'
-
-    if name in docOverrides:
-        docs = docOverrides[name]
-
-    if name in docSubstitutions:
-        post = docSubstitutions[name]
-        newdocs = []
-        for d in docs:
-            for x,y in post.items():
-                d=d.replace(x,y)
-            newdocs.append(d)
-        newdocs[:] = [x for x in newdocs if x.strip()!='']
-        docs=tuple(newdocs)
-
-    if name in extendedDocs:
-        docsLong = extendedDocs[name]
+    record = docIndex.get(name, defaultDocRecord)
+    category = record.category
+
+    if record.docs is not None:
+        docs = record.docs
 
+    if record.substitute is not None:
+        docs = tuple([x for x in map(record.substitute, docs)
+                      if x.strip()!=''])
+
+    notes = ()
     if icat=='Provisional':
-        note = ('','This method is provisional and is subject to change'
-                'in future versions of wxStyledTextCtrl.',)
-        if docsLong==0:
-            docsLong = note
-        else:
-            docsLong = docsLong + note
+        notes = notes + provisionalNote
 
-    if name in sinceAnnotations:
-        note = ('@since '+sinceAnnotations[name],)
-        if docsLong==0:
-            docsLong = note
-        else:
-            docsLong = docsLong + note
+    notes = notes + record.since
 
     if category=='DeprecatedMessages' or icat=='Deprecated':
-        note = ('@deprecated',)
+        notes = notes + ('@deprecated',)
+
+    docsLong = record.docsLong
+    if notes:
         if docsLong==0:
-            docsLong = note
+            docsLong = notes
         else:
-            docsLong = docsLong + note
+            docsLong = docsLong + notes
 
     return category, docs, docsLong
@@ -11,24 +11,40 @@
 #----------------------------------------------------------------------------
 
 
-import sys, string, re, os
-from fileinput import FileInput
+import sys, string, re, os, hashlib, json, pickle, argparse
+from collections import namedtuple
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+# default locations of the inputs and outputs, relative to this script
+SRC_DIR       = os.path.dirname(os.path.abspath(__file__))
 
 sys.dont_write_bytecode = True
+sys.path.insert(0, os.path.join(SRC_DIR, '..', '..', 'build', 'tools'))
 from gen_docs import categoriesList,buildDocs
-
-IFACE         = os.path.abspath('./scintilla/include/Scintilla.iface')
-HDR_SCN       = os.path.abspath('./scintilla/include/Scintilla.h')
-H_TEMPLATE    = os.path.abspath('./stc.h.in')
-IH_TEMPLATE   = os.path.abspath('./stc.interface.h.in')
-CPP_TEMPLATE  = os.path.abspath('./stc.cpp.in')
-H_DEST        = os.path.abspath('../../include/wx/stc/stc.h')
-IH_DEST       = os.path.abspath('../../interface/wx/stc/stc.h')
-CPP_DEST      = os.path.abspath('./stc.cpp')
-if len(sys.argv) > 1 and sys.argv[1] == '--wxpython':
-    DOCSTR_DEST   = os.path.abspath('../../../wxPython/src/_stc_gendocs.i')
-else:
-    DOCSTR_DEST   = None
+from write_if_changed import fileDigest, writeIfChanged, writeStreamIfChanged
+import iface_parser
+
+def srcPath(*components):
+    return os.path.normpath(os.path.join(SRC_DIR, *components))
+
+IFACE         = srcPath('scintilla', 'include', 'Scintilla.iface')
+HDR_SCN       = srcPath('scintilla', 'include', 'Scintilla.h')
+H_TEMPLATE    = srcPath('stc.h.in')
+IH_TEMPLATE   = srcPath('stc.interface.h.in')
+CPP_TEMPLATE  = srcPath('stc.cpp.in')
+H_DEST        = srcPath('..', '..', 'include', 'wx', 'stc', 'stc.h')
+IH_DEST       = srcPath('..', '..', 'interface', 'wx', 'stc', 'stc.h')
+CPP_DEST      = srcPath('stc.cpp')
+GEN_IFACE     = srcPath('gen_iface.py')
+GEN_DOCS      = srcPath('gen_docs.py')
+GEN_PARSER    = srcPath('iface_parser.py')
+MANIFEST      = srcPath('.gen_iface.manifest')
+MODEL_CACHE   = srcPath('.gen_iface.cache')
+WXPYTHON_DOCSTR_DEST = srcPath('..', '..', '..', 'wxPython', 'src', '_stc_gendocs.i')
 
 
 # Value prefixes to convert
@@ -64,6 +80,9 @@ cmdValues = [ 2011,
               (2652, 2653)
             ]
 
+# the same values in a form allowing faster membership tests
+cmdRanges = iface_parser.RangeSet(cmdValues)
+
 
 # Should a function be also generated for the CMDs?
 FUNC_FOR_CMD = 1
@@ -1070,6 +1089,68 @@ methodOverrideMap = {
 
     }
 
+# The overrides above compiled into MethodOverride records, see
+# compileMethodOverrides() below.
+MethodOverride = namedtuple('MethodOverride', 'name theDef makeImp')
+
+# Check all the entries of methodOverrideMap and return a dictionary mapping
+# the original method names to the records containing the new name (None if
+# the method should be skipped), the definition (None to use the default one)
+# and the function taking the message number and returning the
+# implementation (None to use the default one).
+#
+# Raise ValueError describing all the invalid entries, if any.
+def compileMethodOverrides(overrideMap):
+    overrides = {}
+    errors = []
+
+    def makeImpFunc(fmt, name):
+        qualifiedName = 'wxStyledTextCtrl::' + name
+        return lambda number: fmt % (qualifiedName, number) + '\n}'
+
+    for origName, item in sorted(overrideMap.items()):
+        try:
+            name, theDef, theImp = item
+        except (TypeError, ValueError):
+            errors.append('%s: expected a (name, definition, implementation) '
+                          'tuple' % origName)
+            continue
+
+        if name == 0:
+            name = origName
+
+        if name is None:
+            if theDef != 0 or theImp != 0:
+                errors.append('%s: skipped method must not have definition or '
+                              'implementation' % origName)
+            overrides[origName] = MethodOverride(None, None, None)
+            continue
+
+        try:
+            if theDef != 0:
+                theDef = '    ' + (theDef % name)
+            else:
+                theDef = None
+
+            if theImp != 0:
+                makeImp = makeImpFunc(theImp, name)
+                makeImp('0')
+            else:
+                makeImp = None
+        except (TypeError, ValueError, KeyError) as e:
+            errors.append('%s: %s' % (origName, e))
+            continue
+
+        overrides[origName] = MethodOverride(name, theDef, makeImp)
+
+    if errors:
+        raise ValueError('Invalid methodOverrideMap entries:\n    ' +
+                         '\n    '.join(errors))
+
+    return overrides
+
+methodOverrides = compileMethodOverrides(methodOverrideMap)
+
 # all Scintilla getters are transformed into const member of wxSTC class but
 # some non-getter methods are also logically const and this set contains their
 # names (notice that it's useless to include here methods manually overridden
@@ -1100,85 +1181,208 @@ overrideNeeded = (
 
 #----------------------------------------------------------------------------
 
-def processIface(iface, h_tmplt, cpp_tmplt, ih_tmplt, h_dest, cpp_dest, docstr_dest, ih_dest, msgcodes):
-    curDocStrings = []
+# all the inputs can be given either as file names or as file-like objects
+def readText(source):
+    if hasattr(source, 'read'):
+        return source.read()
+
+    f = open(source)
+    try:
+        return f.read()
+    finally:
+        f.close()
+
+def textDigest(text):
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return hashlib.sha1(text).hexdigest()
+
+#----------------------------------------------------------------------------
+
+# build the model used for generating all the outputs from the iface file
+# and the message codes from Scintilla header
+def buildModel(iface, hdr_scn):
     values = []
     methods = []
     cmds = []
-    icat = 'Basics'
+
+    # parse header file for message codes and create dictionary
+    msgcodes = {}
+    processHeader(hdr_scn, msgcodes)
 
     # parse iface file
-    fi = FileInput(iface)
-    for line in fi:
-        line = line[:-1]
-        if line[:2] == '##' or line == '':
-            #curDocStrings = []
-            continue
+    for feature in iface_parser.parseText(readText(iface)).features:
+        if feature.kind == 'val':
+            parseVal(feature.name, feature.value, values, feature.docs,
+                     feature.category)
 
-        op = line[:4]
-        if line[:2] == '# ':   # a doc string
-            curDocStrings.append(line[2:])
+        elif feature.kind in ('fun', 'get', 'set'):
+            parseFun(feature, methods, cmds, msgcodes)
 
-        elif op == 'val ':
-            parseVal(line[4:], values, curDocStrings, icat)
-            curDocStrings = []
+    return { 'values':   values,
+             'cmds':     cmds,
+             'methods':  methods,
+             'msgcodes': msgcodes }
 
-        elif op == 'fun ' or op == 'set ' or op == 'get ':
-            parseFun(line[4:], methods, curDocStrings, cmds, op == 'get ', msgcodes, icat)
-            curDocStrings = []
+#----------------------------------------------------------------------------
 
-        elif op == 'cat ':
-            icat = line[4:].strip()
-            curDocStrings = []
+# the model is cached in a pickle file which is only used if it was created
+# from exactly the same sources by the same version of the generator
+MODEL_CACHE_VERSION = 2
 
-        elif op == 'evt ':
-            pass
+def modelCacheKey(ifaceText, hdrText):
+    return { 'version':   MODEL_CACHE_VERSION,
+             'python':    sys.version_info[0],
+             'inputs':    [textDigest(ifaceText), textDigest(hdrText)],
+             'generator': fileDigests([GEN_IFACE, GEN_DOCS, GEN_PARSER]) }
 
-        elif op == 'enu ':
-            pass
+def loadModel(iface, hdr_scn, cache=None):
+    if not cache:
+        return buildModel(iface, hdr_scn)
 
-        elif op == 'lex ':
-            pass
+    ifaceText = readText(iface)
+    hdrText = readText(hdr_scn)
 
-        else:
-            print('***** Unknown line type: %s' % line)
+    key = modelCacheKey(ifaceText, hdrText)
+    try:
+        f = open(cache, 'rb')
+        try:
+            cachedKey = pickle.load(f)
+            if cachedKey == key:
+                return pickle.load(f)
+        finally:
+            f.close()
+    except Exception:
+        # the cache may be missing, corrupted or created by an incompatible
+        # version, in any case just rebuild it
+        pass
 
-    # build the items for the table of contents in the interface header
-    tableitems=''
-    firstitem=True
-    for category, title, description  in categoriesList:
-        if firstitem:
-            firstitem=False
-        else:
-            tableitems+='\n'
-        tableitems+='    - @ref_member_group{'+category+', '+title+'}'
-
-    # process templates
-    data = {}
-    data['VALUES'] = processVals(values)
-    data['CMDS']   = processVals(cmds)
-    defs, imps, docstrings, idefs = processMethods(methods)
-    data['METHOD_DEFS'] = defs
-    data['METHOD_IDEFS'] = idefs
-    data['METHOD_IMPS'] = imps
-    data['TABLE_OF_CONTENTS'] = tableitems
-
-    # get template text
-    h_text = open(h_tmplt).read()
-    ih_text = open(ih_tmplt).read()
-    cpp_text = open(cpp_tmplt).read()
-
-    # do the substitutions
-    h_text = h_text % data
-    cpp_text = cpp_text % data
-    ih_text = ih_text % data
-
-    # write out destination files
-    open(h_dest, 'w').write(h_text)
-    open(cpp_dest, 'w').write(cpp_text)
+    model = buildModel(StringIO(ifaceText), StringIO(hdrText))
+
+    # the cache may be shared by several concurrently running builds, so
+    # replace it atomically to ensure they never see it partially written
+    def writeCache(f):
+        pickle.dump(key, f, 2)
+        pickle.dump(model, f, 2)
+
+    writeStreamIfChanged(cache, writeCache, 'wb')
+
+    return model
+
+#----------------------------------------------------------------------------
+
+# Generate all the outputs in memory and return them in a dictionary with
+# 'h', 'cpp', 'ih' and, if docstrings is true, 'docstr' keys as well as the
+# keys for all the additional backends from the given list, see the
+# description of outputBackends below.
+#
+# The inputs can be specified either as file names or file-like objects and
+# the optional cache is the name of the file used by loadModel().
+def generate(iface=IFACE, hdr_scn=HDR_SCN,
+             h_tmplt=H_TEMPLATE, cpp_tmplt=CPP_TEMPLATE, ih_tmplt=IH_TEMPLATE,
+             docstrings=False, cache=None, backends=()):
+    model = loadModel(iface, hdr_scn, cache)
+    values = model['values']
+    cmds = model['cmds']
+    methods = prepareMethods(model['methods'])
+
+    texts = {}
+    for key, tmplt in (('h', h_tmplt), ('cpp', cpp_tmplt), ('ih', ih_tmplt)):
+        out = StringIO()
+        renderOutput(out, tmplt, values, cmds, methods)
+        texts[key] = out.getvalue()
+
+    backends = list(backends)
+    if docstrings:
+        backends.insert(0, 'docstr')
+
+    for name in backends:
+        out = StringIO()
+        outputBackends[name](out, model)
+        texts[name] = out.getvalue()
+
+    return texts
+
+#----------------------------------------------------------------------------
+
+# Generate the output files from the model and return the list of flags
+# indicating whether each of them was modified.
+#
+# The backends argument is a list of (backend name, destination) pairs for the
+# additional outputs to generate.
+def processIface(model, h_tmplt, cpp_tmplt, ih_tmplt, h_dest, cpp_dest, docstr_dest, ih_dest, jobs=1, backends=()):
+    outputs = [(h_dest, h_tmplt, None), (cpp_dest, cpp_tmplt, None)]
     if docstr_dest:
-        open(docstr_dest, 'w').write(docstrings)
-    open(ih_dest, 'w').write(ih_text)
+        outputs.append((docstr_dest, None, 'docstr'))
+    outputs.append((ih_dest, ih_tmplt, None))
+    for name, dest in backends:
+        outputs.append((dest, None, name))
+
+    # the outputs are independent of each other and so can be generated in
+    # parallel, if requested, by separate processes
+    if jobs > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+        except ImportError:
+            print('concurrent.futures not available, generating serially.')
+            jobs = 1
+
+    if jobs > 1:
+        # only the parsed model is sent to the worker processes and each of
+        # them does all the work needed for its output, including preparing
+        # the methods, which is the most expensive part of it
+        with ProcessPoolExecutor(min(jobs, len(outputs))) as executor:
+            futures = [executor.submit(generateModelOutput, dest, tmplt, name,
+                                       model)
+                       for dest, tmplt, name in outputs]
+            return [f.result() for f in futures]
+
+    values = model['values']
+    cmds = model['cmds']
+    methods = prepareMethods(model['methods'])
+
+    results = []
+    for dest, tmplt, name in outputs:
+        if name is None:
+            results.append(generateOutput(dest, tmplt, values, cmds, methods))
+        else:
+            results.append(generateBackendOutput(dest, name, model))
+    return results
+
+# generate a single output from the model in a worker process
+def generateModelOutput(dest, tmplt, name, model):
+    if name is not None:
+        return generateBackendOutput(dest, name, model)
+
+    return generateOutput(dest, tmplt, model['values'], model['cmds'],
+                          prepareMethods(model['methods']))
+
+# write out a single destination file, leaving it untouched if it didn't
+# change
+def generateOutput(dest, tmplt, values, cmds, methods):
+    return writeStreamIfChanged(dest,
+                lambda f: renderOutput(f, tmplt, values, cmds, methods))
+
+def generateBackendOutput(dest, name, model):
+    return writeStreamIfChanged(dest,
+                lambda f: outputBackends[name](f, model))
+
+# write the output using the given template
+def renderOutput(out, tmplt, values, cmds, methods):
+    chunks = compileTemplate(readText(tmplt))
+    writeTemplate(out, chunks, makeSections(values, cmds, methods))
+
+def makeSections(values, cmds, methods):
+    # all the generated sections are produced lazily, when they're written
+    # out, so that their full text is never kept in memory
+    return {
+        'VALUES'            : lambda: iterVals(values),
+        'CMDS'              : lambda: iterVals(cmds),
+        'METHOD_DEFS'       : lambda: iterMethodDefs(methods),
+        'METHOD_IDEFS'      : lambda: iterMethodIdefs(methods),
+        'METHOD_IMPS'       : lambda: iterMethodImps(methods),
+        'TABLE_OF_CONTENTS' : iterTableOfContents,
+    }
 
 
 def joinWithNewLines(values):
@@ -1186,11 +1390,604 @@ def joinWithNewLines(values):
 
 #----------------------------------------------------------------------------
 
+# templates use "%(NAME)s" for the generated sections and "%%" for literal
+# percent signs, as with Python string formatting which was used for them
+# before, and are compiled into a list of (literal text, section name) pairs
+templateRegex = re.compile(r'%(?:(%)|\((\w+)\)s)')
+
+def compileTemplate(text):
+    chunks = []
+    literal = []
+    pos = 0
+    for mo in templateRegex.finditer(text):
+        literal.append(text[pos:mo.start()])
+        pos = mo.end()
+        if mo.group(1):
+            literal.append('%')
+        else:
+            chunks.append((''.join(literal), mo.group(2)))
+            literal = []
+    literal.append(text[pos:])
+    chunks.append((''.join(literal), None))
+
+    if templateRegex.sub('', text).find('%') != -1:
+        raise ValueError('Unsupported "%" use in the template.')
+
+    return chunks
+
+def writeLines(out, lines):
+    first = True
+    for line in lines:
+        if first:
+            first = False
+        else:
+            out.write('\n')
+        out.write(line)
+
+def writeTemplate(out, chunks, sections):
+    for literal, section in chunks:
+        out.write(literal)
+        if section is not None:
+            writeLines(out, sections[section]())
+
+#----------------------------------------------------------------------------
+
+# Return the information about all the generated methods in the form suitable
+# for the binding generators: this is a list of dictionaries, in the order of
+# methods declaration, with the following keys:
+#
+#         name      the name of wxStyledTextCtrl method.
+#         iface     the name of the corresponding Scintilla function.
+#         message   the message symbol, e.g. "SCI_ADDTEXT", or the number if
+#                   there is no symbol for it.
+#         number    the numeric value of the message.
+#         const     true if the method is const.
+#         category  the iface category, e.g. "Basics" or "Deprecated".
+#         return    the return type as used by Scintilla, e.g. "position".
+#         wxReturn  the return type as used by wxStyledTextCtrl.
+#         wParam    the first parameter or None if it is unused.
+#         lParam    the second parameter or None if it is unused.
+#         custom    true if the method implementation was customized, i.e.
+#                   it doesn't just call SendMsg() with its parameters.
+#
+# Each of the parameters is a dictionary with "name", "type" (as used by
+# Scintilla) and "wxType" (as used by wxStyledTextCtrl) keys.
+def getMethodsInfo(model):
+    numbers = dict((symbol, int(number))
+                   for number, symbol in model['msgcodes'].items())
+
+    def paramInfo(param):
+        if not param:
+            return None
+        typ, name = param[:2]
+        return { 'name': name,
+                 'type': typ,
+                 'wxType': paramTypeMap.get(typ, typ) }
+
+    info = []
+    for retType, interfName, number, param1, param2, docs, is_const, is_override, icat  in model['methods']:
+        if icat=='Provisional' and not GENERATE_PROVISIONAL_ITEMS:
+            continue
+
+        name, theDef, theImp = checkMethodOverride(interfName, number)
+        if name is None:
+            continue
+
+        info.append({ 'name':     name,
+                      'iface':    interfName,
+                      'message':  number,
+                      'number':   numbers.get(number) or int(number),
+                      'const':    bool(is_const),
+                      'category': icat,
+                      'return':   retType,
+                      'wxReturn': retTypeMap.get(retType, retType),
+                      'wParam':   paramInfo(param1),
+                      'lParam':   paramInfo(param2),
+                      'custom':   theImp is not None })
+
+    return info
+
+# Return the list of (name, value, isCommand) for all the generated values.
+def getValuesInfo(model):
+    return [(name, value, False) for name, value, docs in model['values']] + \
+           [(name, value, True) for name, value, docs in model['cmds']]
+
+#----------------------------------------------------------------------------
+
+# Backends producing additional outputs from the model.
+#
+# Each backend is a function taking the output file-like object and the model
+# returned by loadModel(). Additional backends can be registered by adding
+# them to outputBackends dictionary below, however notice that they're not
+# available in the worker processes when using multiple jobs unless they are
+# registered when this module is imported.
+
+# wxPython docstrings for all methods
+def writeDocStrings(out, model):
+    writeLines(out, iterDocStrings(prepareMethods(model['methods'])))
+
+# JSON manifest of all the methods and values
+def writeJsonManifest(out, model):
+    data = { 'methods': getMethodsInfo(model),
+             'values':  [{ 'name': name, 'value': value, 'command': isCmd }
+                         for name, value, isCmd in getValuesInfo(model)] }
+    out.write(json.dumps(data, indent=1, sort_keys=True,
+                         separators=(',', ': ')))
+    out.write('\n')
+
+# C table of message numbers for all methods, sorted by name, to allow using
+# bsearch() to find the message corresponding to the method name
+def writeCTable(out, model):
+    out.write('/* This file is generated by src/stc/gen_iface.py, do not edit. */\n'
+              '\n'
+              'struct wxSTCMessageEntry\n'
+              '{\n'
+              '    const char* name;\n'
+              '    int message;\n'
+              '};\n'
+              '\n'
+              'static const struct wxSTCMessageEntry wxSTCMessageTable[] =\n'
+              '{\n')
+
+    methods = sorted(getMethodsInfo(model), key=lambda m: m['name'])
+    for m in methods:
+        out.write('    { "%s", %d }, /* %s */\n' %
+                  (m['name'], m['number'], m['message']))
+
+    out.write('};\n'
+              '\n'
+              '#define wxSTC_MESSAGE_TABLE_SIZE %d\n' % len(methods))
+
+# Python module with the dictionaries of the methods and values
+def writePythonTable(out, model):
+    def paramType(param):
+        if param is None:
+            return None
+        return param['type']
+
+    out.write('# This file is generated by src/stc/gen_iface.py, do not edit.\n'
+              '\n'
+              '# Maps wxStyledTextCtrl method names to tuples of message number,\n'
+              '# wParam type, lParam type and return type, using Scintilla types.\n'
+              'methods = {\n')
+    for m in sorted(getMethodsInfo(model), key=lambda m: m['name']):
+        out.write('    %r: (%d, %r, %r, %r),\n' %
+                  (m['name'], m['number'],
+                   paramType(m['wParam']), paramType(m['lParam']), m['return']))
+    out.write('}\n'
+              '\n'
+              '# Maps wxSTC constant names to their values.\n'
+              'values = {\n')
+    for name, value, isCmd in getValuesInfo(model):
+        out.write('    %r: %s,\n' % (name, value))
+    out.write('}\n')
+
+#----------------------------------------------------------------------------
+
+# Support for the dispatch table backend: it generates a C table allowing to
+# find the message number and the kinds of its parameters and of its return
+# value by either wxStyledTextCtrl method name or the Scintilla message
+# symbol, e.g. both "AddText" and "SCI_ADDTEXT", using a minimal perfect hash.
+
+# Scintilla types are mapped to these kinds, any other type uses OTHER kind
+dispatchParamKinds = [
+    # kind suffix     Scintilla types
+    ('NONE',          ()),
+    ('INT',           ('int', 'position', 'keymod')),
+    ('BOOL',          ('bool',)),
+    ('COLOUR',        ('colour',)),
+    ('STRING',        ('string',)),
+    ('STRINGRESULT',  ('stringresult',)),
+    ('CELLS',         ('cells',)),
+    ('TEXTRANGE',     ('textrange',)),
+    ('FINDTEXT',      ('findtext',)),
+    ('FORMATRANGE',   ('formatrange',)),
+    ('OTHER',         ()),
+]
+
+dispatchReturnKinds = [
+    # kind suffix     Scintilla types
+    ('VOID',          ('void',)),
+    ('INT',           ('int', 'position')),
+    ('BOOL',          ('bool',)),
+    ('COLOUR',        ('colour',)),
+    ('OTHER',         ()),
+]
+
+def makeKindMap(kinds):
+    kindMap = {}
+    for kind, types in kinds:
+        for typ in types:
+            kindMap[typ] = kind
+    return kindMap
+
+dispatchParamKindMap = makeKindMap(dispatchParamKinds)
+dispatchReturnKindMap = makeKindMap(dispatchReturnKinds)
+
+# FNV-1a hash with the given seed, this must be kept in sync with the
+# wxSTCDispatchHash() function in dispatchLookupCode below
+def dispatchHash(seed, key):
+    h = (2166136261 ^ (seed * 2654435769)) & 0xffffffff
+    for c in bytearray(key.encode('ascii')):
+        h = ((h ^ c) * 16777619) & 0xffffffff
+    return h
+
+dispatchLookupCode = '''\
+static unsigned long wxSTCDispatchHash(unsigned long seed, const char* key)
+{
+    unsigned long h = (2166136261ul ^ (seed * 2654435769ul)) & 0xfffffffful;
+    for ( ; *key; ++key )
+        h = ((h ^ (unsigned char)*key) * 16777619ul) & 0xfffffffful;
+    return h;
+}
+
+/* Return the entry for the given method name or message symbol or NULL. */
+static const struct wxSTCDispatchEntry* wxSTCFindDispatchEntry(const char* key)
+{
+    const struct wxSTCDispatchEntry* entry;
+    unsigned long slot;
+    int d;
+
+    d = wxSTCDispatchDisplacements[wxSTCDispatchHash(0, key) % wxSTC_DISPATCH_TABLE_SIZE];
+    if ( d < 0 )
+        slot = (unsigned long)(-d - 1);
+    else
+        slot = wxSTCDispatchHash((unsigned long)d, key) % wxSTC_DISPATCH_TABLE_SIZE;
+
+    entry = &wxSTCDispatchTable[slot];
+    return strcmp(entry->name, key) == 0 ? entry : NULL;
+}
+'''
+
+# Build a minimal perfect hash for the given keys using "hash and displace"
+# algorithm: the keys are distributed into buckets using the hash with 0 seed
+# and for each bucket with several keys a seed putting all of them into free
+# slots is found, while the keys alone in their buckets are put directly into
+# the remaining slots, which is indicated by storing the negative slot index
+# minus 1 in the displacements table.
+#
+# Return the displacements table and the list of slots of all keys, which
+# must be all different.
+def makePerfectHash(keys):
+    # the seed search below would never end for the duplicate keys
+    if len(set(keys)) != len(keys):
+        seen = set()
+        duplicates = set()
+        for key in keys:
+            if key in seen:
+                duplicates.add(key)
+            seen.add(key)
+        raise ValueError('Duplicate keys in the dispatch table: %s.' %
+                         ', '.join(sorted(duplicates)))
+
+    size = len(keys)
+    buckets = [[] for i in range(size)]
+    for i, key in enumerate(keys):
+        buckets[dispatchHash(0, key) % size].append(i)
+
+    displacements = [0] * size
+    slots = [None] * size
+    used = [False] * size
+
+    order = sorted(range(size), key=lambda b: -len(buckets[b]))
+    for b in order:
+        bucket = buckets[b]
+        if len(bucket) <= 1:
+            break
+
+        seed = 1
+        while True:
+            bucketSlots = [dispatchHash(seed, keys[i]) % size for i in bucket]
+            if len(set(bucketSlots)) == len(bucket) and \
+                    not any([used[slot] for slot in bucketSlots]):
+                break
+            seed += 1
+
+        displacements[b] = seed
+        for i, slot in zip(bucket, bucketSlots):
+            slots[i] = slot
+            used[slot] = True
+
+    free = [slot for slot in range(size) if not used[slot]]
+    for b in order:
+        bucket = buckets[b]
+        if len(bucket) == 1:
+            slot = free.pop()
+            displacements[b] = -slot - 1
+            slots[bucket[0]] = slot
+
+    return displacements, slots
+
+# C dispatch table for all methods and Scintilla messages
+def writeDispatchTable(out, model):
+    entries = []
+
+    def paramKind(param):
+        if not param:
+            return 'NONE'
+        return dispatchParamKindMap.get(param[0], 'OTHER')
+
+    def addEntry(name, number, param1, param2, retType):
+        entries.append((name, int(number),
+                        paramKind(param1), paramKind(param2),
+                        dispatchReturnKindMap.get(retType, 'OTHER')))
+
+    def paramTuple(param):
+        if param is None:
+            return None
+        return (param['type'], param['name'])
+
+    for m in getMethodsInfo(model):
+        addEntry(m['name'], m['number'],
+                 paramTuple(m['wParam']), paramTuple(m['lParam']), m['return'])
+
+    # also add the entries for all Scintilla messages corresponding to the
+    # iface functions, even if they're not wrapped by wxStyledTextCtrl
+    numbers = dict((symbol, number)
+                   for number, symbol in model['msgcodes'].items())
+    for retType, interfName, code, param1, param2, docs, is_const, is_override, icat in model['methods']:
+        if code in numbers:
+            addEntry(code, numbers.pop(code), param1, param2, retType)
+
+    displacements, slots = makePerfectHash([e[0] for e in entries])
+    table = [None] * len(entries)
+    for e, slot in zip(entries, slots):
+        table[slot] = e
+
+    out.write('/* This file is generated by src/stc/gen_iface.py, do not edit. */\n'
+              '\n'
+              '#include <string.h>\n'
+              '\n')
+
+    out.write('enum wxSTCDispatchParamKind\n{\n%s\n};\n\n' %
+              ',\n'.join(['    wxSTC_DISPATCH_PARAM_' + kind
+                           for kind, types in dispatchParamKinds]))
+
+    out.write('enum wxSTCDispatchReturnKind\n{\n%s\n};\n\n' %
+              ',\n'.join(['    wxSTC_DISPATCH_RETURN_' + kind
+                           for kind, types in dispatchReturnKinds]))
+
+    out.write('struct wxSTCDispatchEntry\n'
+              '{\n'
+              '    const char* name;\n'
+              '    int message;\n'
+              '    enum wxSTCDispatchParamKind wParam;\n'
+              '    enum wxSTCDispatchParamKind lParam;\n'
+              '    enum wxSTCDispatchReturnKind ret;\n'
+              '};\n'
+              '\n'
+              '#define wxSTC_DISPATCH_TABLE_SIZE %du\n'
+              '\n' % len(table))
+
+    out.write('static const struct wxSTCDispatchEntry '
+              'wxSTCDispatchTable[wxSTC_DISPATCH_TABLE_SIZE] =\n{\n')
+    for name, number, wParam, lParam, ret in table:
+        out.write('    { "%s", %d, wxSTC_DISPATCH_PARAM_%s, '
+                  'wxSTC_DISPATCH_PARAM_%s, wxSTC_DISPATCH_RETURN_%s },\n' %
+                  (name, number, wParam, lParam, ret))
+    out.write('};\n\n')
+
+    out.write('static const int '
+              'wxSTCDispatchDisplacements[wxSTC_DISPATCH_TABLE_SIZE] =\n{\n')
+    for i in range(0, len(displacements), 10):
+        out.write('    %s,\n' %
+                  ', '.join([str(d) for d in displacements[i:i + 10]]))
+    out.write('};\n\n')
+
+    out.write(dispatchLookupCode)
+
+#----------------------------------------------------------------------------
+
+outputBackends = {
+    'docstr'  : writeDocStrings,
+    'json'    : writeJsonManifest,
+    'c'       : writeCTable,
+    'python'  : writePythonTable,
+    'dispatch': writeDispatchTable,
+}
+
+#----------------------------------------------------------------------------
+
+# Split the text generated from the template into the generated sections,
+# return None if the text doesn't match the template.
+def extractSections(text, chunks):
+    sections = {}
+    pos = 0
+    for i in range(len(chunks)):
+        literal, section = chunks[i]
+        if not text.startswith(literal, pos):
+            return None
+        pos += len(literal)
+        if section is None:
+            break
+
+        nextLiteral = chunks[i + 1][0]
+        if chunks[i + 1][1] is None:
+            end = len(text) - len(nextLiteral)
+        else:
+            end = text.find(nextLiteral, pos)
+        if end < pos:
+            return None
+
+        sections[section] = text[pos:end]
+        pos = end
+
+    if pos != len(text):
+        return None
+
+    return sections
+
+#----------------------------------------------------------------------------
+
+# support for the diff mode: the values and methods generated from the model
+# are compared with those in the existing output files, using indices mapping
+# the value names to their values and the method names to their signatures
+# and the message numbers they use
+
+defineRegex = re.compile(r'^#define (\w+) (.*)$', re.MULTILINE)
+impRegex = re.compile(r'^[ \t]*([\w:<>*& \t]*?)[ \t]*'  # return type
+                      r'\bwxStyledTextCtrl::(\w+)'      # name
+                      r'\(([^)]*)\)'                    # (params)
+                      r'([ \t]*const)?', re.MULTILINE)  # const
+# the message is either passed to SendMsg() directly or, in some overridden
+# methods, stored in a "msg" variable first
+sendMsgRegex = re.compile(r'const int msg = (\w+);|SendMsg\((\w+)')
+
+# return the name and the index entry for the method implementation starting
+# at the given match of impRegex and ending at the given position
+def methodIndexEntry(mo, end):
+    retType, name, params, const = mo.groups()
+    signature = '%s %s(%s)%s' % (retType, name, params, const or '')
+
+    num = sendMsgRegex.search(mo.string, mo.start(), end)
+    if num:
+        num = num.group(1) or num.group(2)
+    return name, (' '.join(signature.split()), num)
+
+def indexImps(text):
+    methods = {}
+    starts = list(impRegex.finditer(text))
+    for i, mo in enumerate(starts):
+        if i + 1 < len(starts):
+            end = starts[i + 1].start()
+        else:
+            end = len(text)
+        name, entry = methodIndexEntry(mo, end)
+        methods[name] = entry
+    return methods
+
+def indexModel(model):
+    values = {}
+    for name, value, docs in model['values'] + model['cmds']:
+        values[name] = value
+
+    # the messages used by the methods are known from the model, so don't
+    # rely on finding them in the implementations
+    numbers = {}
+    for method in model['methods']:
+        number = method[2]
+        name, theDef, theImp = checkMethodOverride(method[1], number)
+        if name is not None:
+            numbers[name] = number
+
+    methods = {}
+    for name, category, icat, docs, docsLong, theDef, theImp, is_override in \
+            prepareMethods(model['methods']):
+        for impName, (signature, number) in indexImps(theImp).items():
+            methods[impName] = (signature, numbers.get(impName, number))
+
+    return values, methods
+
+def indexOutputs(h_dest, h_tmplt, cpp_dest, cpp_tmplt):
+    h_sections = extractSections(readText(h_dest),
+                                 compileTemplate(readText(h_tmplt)))
+    if h_sections is None:
+        raise ValueError('"%s" doesn\'t match its template.' % h_dest)
+
+    cpp_sections = extractSections(readText(cpp_dest),
+                                   compileTemplate(readText(cpp_tmplt)))
+    if cpp_sections is None:
+        raise ValueError('"%s" doesn\'t match its template.' % cpp_dest)
+
+    values = {}
+    for section in ('VALUES', 'CMDS'):
+        for name, value in defineRegex.findall(h_sections[section]):
+            values[name] = value
+
+    return values, indexImps(cpp_sections['METHOD_IMPS'])
+
+def diffIndices(old, new):
+    added = sorted([k for k in new if k not in old])
+    removed = sorted([k for k in old if k not in new])
+    changed = sorted([k for k in new if k in old and new[k] != old[k]])
+    return added, removed, changed
+
+# Return the lines of the report describing the differences between the
+# existing outputs and the ones which would be generated from the model.
+def makeDiffReport(model, h_dest, h_tmplt, cpp_dest, cpp_tmplt):
+    oldValues, oldMethods = indexOutputs(h_dest, h_tmplt, cpp_dest, cpp_tmplt)
+    newValues, newMethods = indexModel(model)
+
+    def describeMethod(entry):
+        signature, number = entry
+        if number is None:
+            return signature
+        return '%s [%s]' % (signature, number)
+
+    lines = []
+
+    added, removed, changed = diffIndices(oldValues, newValues)
+    lines.append('Values: %d added, %d removed, %d changed' %
+                 (len(added), len(removed), len(changed)))
+    for name in added:
+        lines.append('+ %s %s' % (name, newValues[name]))
+    for name in removed:
+        lines.append('- %s %s' % (name, oldValues[name]))
+    for name in changed:
+        lines.append('~ %s %s -> %s' % (name, oldValues[name], newValues[name]))
+
+    added, removed, changed = diffIndices(oldMethods, newMethods)
+    lines.append('Methods: %d added, %d removed, %d changed' %
+                 (len(added), len(removed), len(changed)))
+    for name in added:
+        lines.append('+ ' + describeMethod(newMethods[name]))
+    for name in removed:
+        lines.append('- ' + describeMethod(oldMethods[name]))
+    for name in changed:
+        lines.append('~ ' + describeMethod(oldMethods[name]))
+        lines.append('  ' + describeMethod(newMethods[name]))
+
+    return lines
+
+#----------------------------------------------------------------------------
+
+# support for the incremental mode: the manifest records the digests of all
+# the inputs and outputs of the last run, allowing to skip regeneration
+# entirely if none of them changed since then
+MANIFEST_VERSION = 1
+
+def fileDigests(filenames):
+    return dict((f, fileDigest(f)) for f in filenames)
+
+def loadManifest(manifest):
+    try:
+        data = json.load(open(manifest))
+    except (IOError, ValueError):
+        return None
+
+    if data.get('version') != MANIFEST_VERSION:
+        return None
+
+    return data
+
+def saveManifest(manifest, inputs, outputs):
+    data = { 'version': MANIFEST_VERSION,
+             'inputs':  fileDigests(inputs),
+             'outputs': fileDigests(outputs) }
+    writeIfChanged(manifest, json.dumps(data, indent=1, sort_keys=True,
+                                        separators=(',', ': ')) + '\n')
+
+def isUpToDate(manifest, inputs, outputs):
+    data = loadManifest(manifest)
+    if data is None:
+        return False
+
+    if data['inputs'] != fileDigests(inputs):
+        return False
+
+    # also check that the outputs were not modified (or removed) manually
+    for f in outputs:
+        digest = data['outputs'].get(f)
+        if digest is None or digest != fileDigest(f):
+            return False
+
+    return True
+
+#----------------------------------------------------------------------------
+
 # parse header file for message codes
 def processHeader(hdr_scn, codeDict):
-    fh = FileInput(hdr_scn)
-    for line in fh:
-        line = line[:-1]
+    for line in readText(hdr_scn).splitlines():
         if line[:8] != '#define ':
             continue
 
@@ -1210,28 +2007,31 @@ def processHeader(hdr_scn, codeDict):
 
 #----------------------------------------------------------------------------
 
-def processVals(values):
-    text = []
+def iterVals(values):
     for name, value, docs in values:
         if docs:
-            text.append('')
+            yield ''
             for x in docs:
-                text.append('/// ' + x)
-        text.append('#define %s %s' % (name, value))
-    return joinWithNewLines(text)
+                yield '/// ' + x
+        yield '#define %s %s' % (name, value)
+
+def processVals(values):
+    return joinWithNewLines(iterVals(values))
 
 #----------------------------------------------------------------------------
 
-def processMethods(methods):
-    defs = []
-    idefs = []
-    imps = []
-    dstr = []
-    piecesForInterface = {}
+def iterTableOfContents():
+    # the items for the table of contents in the interface header
+    for category, title, description  in categoriesList:
+        yield '    - @ref_member_group{'+category+', '+title+'}'
 
-    # Initialize each of the piecesForInterface with an empty list
-    for c in categoriesList:
-        piecesForInterface[c[0]]=[]
+#----------------------------------------------------------------------------
+
+# Return the list of the methods to generate with all the information needed
+# for generating the different outputs for them: each item of it is a tuple
+# (name, category, icat, docs, docsLong, theDef, theImp, is_override).
+def prepareMethods(methods):
+    prepared = []
 
     for retType, interfName, number, param1, param2, docs, is_const, is_override, icat  in methods:
         retType = retTypeMap.get(retType, retType)
@@ -1247,16 +2047,7 @@ def processMethods(methods):
 
         category, docs, docsLong = buildDocs(interfName, docs, icat)
 
-        # Build docstrings
-        st = 'DocStr(wxStyledTextCtrl::%s,\n' \
-             '"%s", "");\n' % (name, joinWithNewLines(docs))
-        dstr.append(st)
-
         # Build the method definition for the .h file
-        if docs:
-            defs.append('')
-            for x in docs:
-                defs.append('    // ' + x)
         if not theDef:
             theDef = '    %s %s(%s)' % (retType, name, params)
             if is_const:
@@ -1264,11 +2055,64 @@ def processMethods(methods):
             if is_override:
                 theDef = theDef + ' wxOVERRIDE'
             theDef = theDef + ';'
+
+        # Build the method implementation string
+        if not theImp:
+            theImp = '%s wxStyledTextCtrl::%s(%s)' % (retType, name, params)
+            if is_const:
+                theImp = theImp + ' const'
+            theImp = theImp + '\n{\n    '
+            if retType == 'wxColour':
+                theImp = theImp + 'long c = '
+            elif retType != 'void':
+                theImp = theImp + 'return '
+            theImp = theImp + 'SendMsg(%s, %s, %s)' % (number,
+                                                       makeArgString(param1),
+                                                       makeArgString(param2))
+            if retType == 'bool':
+                theImp = theImp + ' != 0'
+            if retType == 'wxColour':
+                theImp = theImp + ';\n    return wxColourFromLong(c)'
+
+            theImp = theImp + ';\n}'
+
+        prepared.append((name, category, icat, docs, docsLong,
+                         theDef, theImp, is_override))
+
+    return prepared
+
+def iterDocStrings(methods):
+    for name, category, icat, docs, docsLong, theDef, theImp, is_override in methods:
+        yield 'DocStr(wxStyledTextCtrl::%s,\n' \
+              '"%s", "");\n' % (name, joinWithNewLines(docs))
+
+def iterMethodDefs(methods):
+    for name, category, icat, docs, docsLong, theDef, theImp, is_override in methods:
+        if docs:
+            yield ''
+            for x in docs:
+                yield '    // ' + x
         if category=='DeprecatedMessages' or icat=='Deprecated':
-            defs.append('    wxDEPRECATED_MSG( "This method uses a function '
-                        'deprecated in the Scintilla library." )')
-        defs.append(theDef)
+            yield ('    wxDEPRECATED_MSG( "This method uses a function '
+                   'deprecated in the Scintilla library." )')
+        yield theDef
+
+def iterMethodImps(methods):
+    for name, category, icat, docs, docsLong, theDef, theImp, is_override in methods:
+        if docs:
+            yield ''
+            for x in docs:
+                yield '// ' + x
+        yield theImp
 
+def iterMethodIdefs(methods):
+    piecesForInterface = {}
+
+    # Initialize each of the piecesForInterface with an empty list
+    for c in categoriesList:
+        piecesForInterface[c[0]]=[]
+
+    for name, category, icat, docs, docsLong, theDef, theImp, is_override in methods:
         # Skip override from the interface file
         if is_override:
           theDef = theDef.replace(' wxOVERRIDE', '')
@@ -1296,71 +2140,44 @@ def processMethods(methods):
 
         piecesForInterface[category]+=intrflines
 
-
-        # Build the method implementation string
-        if docs:
-            imps.append('')
-            for x in docs:
-                imps.append('// ' + x)
-        if not theImp:
-            theImp = '%s wxStyledTextCtrl::%s(%s)' % (retType, name, params)
-            if is_const:
-                theImp = theImp + ' const'
-            theImp = theImp + '\n{\n    '
-            if retType == 'wxColour':
-                theImp = theImp + 'long c = '
-            elif retType != 'void':
-                theImp = theImp + 'return '
-            theImp = theImp + 'SendMsg(%s, %s, %s)' % (number,
-                                                       makeArgString(param1),
-                                                       makeArgString(param2))
-            if retType == 'bool':
-                theImp = theImp + ' != 0'
-            if retType == 'wxColour':
-                theImp = theImp + ';\n    return wxColourFromLong(c)'
-
-            theImp = theImp + ';\n}'
-        imps.append(theImp)
-
     # For the interface file, merge all the pieces into one list
     for c in categoriesList:
-        idefs.append('')
-        idefs.append('    /**')
-        idefs.append('        @member_group_name{' + c[0] + ', ' + c[1] + '}')
+        yield ''
+        yield '    /**'
+        yield '        @member_group_name{' + c[0] + ', ' + c[1] + '}'
 
         if c[2] != 0:
-            idefs.append('')
+            yield ''
             for z in c[2]:
-                idefs.append('        ' + z)
+                yield '        ' + z
 
-        idefs.append('    */')
-        idefs.append('    //@{')
+        yield '    */'
+        yield '    //@{'
 
-        idefs+=piecesForInterface[c[0]]
-        idefs.append('')
-        idefs.append('    //@}')
+        for line in piecesForInterface[c[0]]:
+            yield line
+        yield ''
+        yield '    //@}'
 
-    return joinWithNewLines(defs), joinWithNewLines(imps), joinWithNewLines(dstr), joinWithNewLines(idefs)
+def processMethods(methods):
+    methods = prepareMethods(methods)
+    return joinWithNewLines(iterMethodDefs(methods)), \
+           joinWithNewLines(iterMethodImps(methods)), \
+           joinWithNewLines(iterDocStrings(methods)), \
+           joinWithNewLines(iterMethodIdefs(methods))
 
 #----------------------------------------------------------------------------
 
 def checkMethodOverride(name, number):
-    theDef = theImp = None
-    if name in methodOverrideMap:
-        item = methodOverrideMap[name]
+    override = methodOverrides.get(name)
+    if override is None:
+        return name, None, None
 
-        try:
-            if item[0] != 0:
-                name = item[0]
-            if item[1] != 0:
-                theDef = '    ' + (item[1] % name)
-            if item[2] != 0:
-                theImp = item[2] % ('wxStyledTextCtrl::'+name, number) + '\n}'
-        except:
-            print("************* " + name)
-            raise
-
-    return name, theDef, theImp
+    theImp = None
+    if override.makeImp is not None:
+        theImp = override.makeImp(number)
+
+    return override.name, override.theDef, theImp
 
 #----------------------------------------------------------------------------
 
@@ -1396,12 +2213,13 @@ def makeParamString(param1, param2):
 
 #----------------------------------------------------------------------------
 
-def parseVal(line, values, docs, icat):
-    name, val = line.split('=')
-
+def parseVal(name, val, values, docs, icat):
     if name in notMappedSciValues:
             return
 
+    # don't modify the docs stored in the parsed interface
+    docs = list(docs)
+
     if icat=='Deprecated':
         docs.append('@deprecated')
 
@@ -1426,67 +2244,128 @@ def parseVal(line, values, docs, icat):
 
 #----------------------------------------------------------------------------
 
-funregex = re.compile(r'\s*([a-zA-Z0-9_]+)'  # <ws>return type
-                      '\s+([a-zA-Z0-9_]+)='  # <ws>name=
-                      '([0-9]+)'             # number
-                      '\(([ a-zA-Z0-9_]*),'  # (param,
-                      '([ a-zA-Z0-9_]*),*\)')  # param)
-
-def parseFun(line, methods, docs, values, is_const, msgcodes, icat):
-    def parseParam(param):
-        param = param.strip()
-        if param == '':
-            param = None
-        else:
-            param = tuple(param.split())
-        return param
-
-    mo = funregex.match(line)
-    if mo is None:
-        print("***** Line doesn't match! : %s" % line)
-
-    retType, name, number, param1, param2 = mo.groups()
-
-    param1 = parseParam(param1)
-    param2 = parseParam(param2)
+def parseFun(fun, methods, values, msgcodes):
+    name = fun.name
+    number = fun.number
+    docs = fun.docs
 
     # Special case.  For the key command functions we want a value defined too
-    num = int(number)
-    for v in cmdValues:
-        if (type(v) == type(()) and v[0] <= num <= v[1]) or v == num:
-            parseVal('CMD_%s=%s' % (name.upper(), number), values, docs, 'Basics')
-
-            # if we are not also doing a function for CMD values, then
-            # just return, otherwise fall through to the append blow.
-            if not FUNC_FOR_CMD:
-                return
+    if int(number) in cmdRanges:
+        parseVal('CMD_%s' % name.upper(), number, values, docs, 'Basics')
+
+        # if we are not also doing a function for CMD values, then
+        # just return, otherwise fall through to the append blow.
+        if not FUNC_FOR_CMD:
+            return
 
     # if possible, replace numeric value with symbol
     if number in msgcodes:
         code = msgcodes[number]
     else:
         code = number
-    methods.append( (retType, name, code, param1, param2, tuple(docs),
-                     is_const or name in constNonGetterMethods,
-                     name in overrideNeeded, icat) )
+    methods.append( (fun.retType, name, code, fun.param1, fun.param2,
+                     tuple(docs),
+                     fun.isGetter() or name in constNonGetterMethods,
+                     name in overrideNeeded, fun.category) )
 
 
 #----------------------------------------------------------------------------
 
 
 def main(args):
-    # TODO: parse command line args to replace default input/output files???
-
-    if not os.path.exists(IFACE):
-        print('Please run this script from src/stc subdirectory.')
-        sys.exit(1)
-
-    # parse header file for message codes and create dictionary
-    msgcodes = {}
-    processHeader(HDR_SCN, msgcodes)
+    parser = argparse.ArgumentParser(
+                description='Generate wxStyledTextCtrl sources from the '
+                            'Scintilla interface definition.')
+    parser.add_argument('--iface', default=IFACE,
+                        help='Scintilla.iface file to use')
+    parser.add_argument('--header', dest='hdr_scn', default=HDR_SCN,
+                        help='Scintilla.h file to use')
+    parser.add_argument('--h-template', default=H_TEMPLATE,
+                        help='template for the header')
+    parser.add_argument('--cpp-template', default=CPP_TEMPLATE,
+                        help='template for the implementation')
+    parser.add_argument('--ih-template', default=IH_TEMPLATE,
+                        help='template for the interface header')
+    parser.add_argument('--h-dest', default=H_DEST,
+                        help='header to generate')
+    parser.add_argument('--cpp-dest', default=CPP_DEST,
+                        help='implementation file to generate')
+    parser.add_argument('--ih-dest', default=IH_DEST,
+                        help='interface header to generate')
+    parser.add_argument('--docstr-dest', metavar='FILE',
+                        help='also generate wxPython docstrings in FILE')
+    parser.add_argument('--backend', action='append', default=[],
+                        metavar='NAME=FILE',
+                        help='also generate the output of the given backend '
+                             '(%s) in FILE' % ', '.join(sorted(outputBackends)))
+    parser.add_argument('--wxpython', action='store_const',
+                        dest='docstr_dest', const=WXPYTHON_DOCSTR_DEST,
+                        help='generate wxPython docstrings in the default '
+                             'location')
+    parser.add_argument('--incremental', nargs='?', metavar='MANIFEST',
+                        const=MANIFEST,
+                        help="don't do anything if neither the inputs nor "
+                             "the outputs changed since the last run")
+    parser.add_argument('--cache', nargs='?', metavar='FILE',
+                        const=MODEL_CACHE,
+                        help='reuse the previously parsed model if possible')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes to use')
+    parser.add_argument('--diff', action='store_true',
+                        help="don't write anything but show the values and "
+                             "methods which would be added, removed or "
+                             "changed in the existing outputs")
+    options = parser.parse_args(args[1:])
+
+    if not os.path.exists(options.iface):
+        parser.error('interface file "%s" not found.' % options.iface)
+
+    backends = []
+    for backend in options.backend:
+        name, sep, dest = backend.partition('=')
+        if not sep or not dest:
+            parser.error('invalid --backend value "%s".' % backend)
+        if name not in outputBackends:
+            parser.error('unknown backend "%s".' % name)
+        backends.append((name, dest))
+
+    if options.diff:
+        model = loadModel(options.iface, options.hdr_scn, options.cache)
+        try:
+            report = makeDiffReport(model,
+                                    options.h_dest, options.h_template,
+                                    options.cpp_dest, options.cpp_template)
+        except (IOError, ValueError) as e:
+            print('Can\'t compare with the existing files: %s' % e)
+            sys.exit(1)
+
+        print('\n'.join(report))
+        return
+
+    # with --incremental, don't do anything if neither the inputs nor the
+    # outputs changed since the last run
+    inputs = [options.iface, options.hdr_scn,
+              options.h_template, options.cpp_template, options.ih_template,
+              GEN_IFACE, GEN_DOCS, GEN_PARSER]
+    outputs = [options.h_dest, options.cpp_dest, options.ih_dest]
+    if options.docstr_dest:
+        outputs.append(options.docstr_dest)
+    outputs += [dest for name, dest in backends]
+
+    if options.incremental and isUpToDate(options.incremental, inputs, outputs):
+        print('Generated files are up to date.')
+        return
+
+    model = loadModel(options.iface, options.hdr_scn, options.cache)
 
     # Now just do it
-    processIface(IFACE, H_TEMPLATE, CPP_TEMPLATE, IH_TEMPLATE, H_DEST, CPP_DEST, DOCSTR_DEST, IH_DEST, msgcodes)
+    processIface(model,
+                 options.h_template, options.cpp_template, options.ih_template,
+                 options.h_dest, options.cpp_dest, options.docstr_dest,
+                 options.ih_dest, options.jobs, backends)
+
+    if options.incremental:
+        saveManifest(options.incremental, inputs, outputs)
 
 
 
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+#----------------------------------------------------------------------------
+# Name:         src/stc/iface_parser.py
+# Purpose:      Parser for the Scintilla.iface interface definition file
+#               used by gen_iface.py and other tools working with it.
+# Author:       wxWidgets development team
+# Created:      2026-10-17
+# Copyright:    (c) 2026 wxWidgets development team
+# Licence:      wxWindows licence
+#----------------------------------------------------------------------------
+
+import re
+from bisect import bisect_right
+
+
+# The iface file is line-oriented, see the comments at its top for the full
+# description of its grammar. Each line is either empty, a comment ("##"), a
+# documentation comment ("# ") applying to the next feature or a feature
+# definition starting with a 3 letter keyword followed by a space.
+#
+# Documentation comments are attached to the next val, fun, get or set
+# feature. The "cat" lines discard any pending documentation while "evt",
+# "enu" and "lex" lines leave it in place, so that a comment preceding an
+# enumeration or a lexer definition applies to the first value of it.
+
+_lineRegex = re.compile(r'^(?:##.*'                          # comment
+                        r'|# (?P<doc>.*)'                    # doc string
+                        r'|(?P<kind>[a-z]{3}) (?P<body>.*)'  # feature
+                        r'|(?P<other>.+)'                    # anything else
+                        r')?$', re.MULTILINE)
+
+_funRegex = re.compile(r'\s*([a-zA-Z0-9_]+)'    # <ws>return type
+                       r'\s+([a-zA-Z0-9_]+)='   # <ws>name=
+                       r'([0-9]+)'              # number
+                       r'\(([ a-zA-Z0-9_]*),'   # (param,
+                       r'([ a-zA-Z0-9_]*),*\)') # param)
+
+_evtRegex = re.compile(r'\s*([a-zA-Z0-9_]+)'    # <ws>return type
+                       r'\s+([a-zA-Z0-9_]+)='   # <ws>name=
+                       r'([0-9]+)'              # number
+                       r'\((.*)\)')             # (params)
+
+_listRegex = re.compile(r'\s*([a-zA-Z0-9_]+)'   # <ws>name
+                        r'=(.*)')               # =values
+
+
+class IfaceError(Exception):
+    def __init__(self, lineno, message):
+        Exception.__init__(self, 'line %d: %s' % (lineno, message))
+        self.lineno = lineno
+
+#----------------------------------------------------------------------------
+
+class Feature(object):
+    """Base class for all the features defined in the iface file."""
+    __slots__ = ('lineno', 'category', 'docs')
+
+    kind = None
+
+    def __init__(self, lineno, category, docs):
+        self.lineno = lineno
+        self.category = category
+        self.docs = docs
+
+    def __getstate__(self):
+        return dict((slot, getattr(self, slot))
+                    for cls in type(self).__mro__
+                    for slot in getattr(cls, '__slots__', ()))
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, getattr(self, 'name', ''))
+
+
+class Value(Feature):
+    """A "val" line: a named constant."""
+    __slots__ = ('name', 'value')
+
+    kind = 'val'
+
+    def __init__(self, lineno, category, docs, name, value):
+        Feature.__init__(self, lineno, category, docs)
+        self.name = name
+        self.value = value
+
+
+class Function(Feature):
+    """A "fun", "get" or "set" line: a message sent to Scintilla.
+
+    Each of the parameters is either None or a tuple of the parameter type and
+    name.
+    """
+    __slots__ = ('kind', 'retType', 'name', 'number', 'param1', 'param2')
+
+    def __init__(self, lineno, category, docs, kind,
+                 retType, name, number, param1, param2):
+        Feature.__init__(self, lineno, category, docs)
+        self.kind = kind
+        self.retType = retType
+        self.name = name
+        self.number = number
+        self.param1 = param1
+        self.param2 = param2
+
+    def isGetter(self):
+        return self.kind == 'get'
+
+
+class Event(Feature):
+    """An "evt" line: a notification sent by Scintilla."""
+    __slots__ = ('retType', 'name', 'number', 'params')
+
+    kind = 'evt'
+
+    def __init__(self, lineno, category, docs, retType, name, number, params):
+        Feature.__init__(self, lineno, category, docs)
+        self.retType = retType
+        self.name = name
+        self.number = number
+        self.params = params
+
+
+class Enumeration(Feature):
+    """An "enu" line: associates the values with the given prefixes."""
+    __slots__ = ('name', 'prefixes')
+
+    kind = 'enu'
+
+    def __init__(self, lineno, category, docs, name, prefixes):
+        Feature.__init__(self, lineno, category, docs)
+        self.name = name
+        self.prefixes = prefixes
+
+
+class Lexer(Feature):
+    """A "lex" line: associates a lexer with its lexical states prefixes."""
+    __slots__ = ('name', 'lexerVal', 'prefixes')
+
+    kind = 'lex'
+
+    def __init__(self, lineno, category, docs, name, lexerVal, prefixes):
+        Feature.__init__(self, lineno, category, docs)
+        self.name = name
+        self.lexerVal = lexerVal
+        self.prefixes = prefixes
+
+
+class Category(Feature):
+    """A "cat" line: starts a new category of features."""
+    __slots__ = ('name',)
+
+    kind = 'cat'
+
+    def __init__(self, lineno, category, docs, name):
+        Feature.__init__(self, lineno, category, docs)
+        self.name = name
+
+#----------------------------------------------------------------------------
+
+class Interface(object):
+    """The parsed contents of the iface file.
+
+    All the features are available, in the order of their appearance in the
+    file, in the features list and are also available in the lists for each
+    kind of them.
+    """
+    __slots__ = ('features', 'values', 'functions', 'events',
+                 'enumerations', 'lexers', 'categories')
+
+    def __init__(self):
+        self.features = []
+        self.values = []
+        self.functions = []
+        self.events = []
+        self.enumerations = []
+        self.lexers = []
+        self.categories = []
+
+    def __getstate__(self):
+        return (self.features,)
+
+    def __setstate__(self, state):
+        self.__init__()
+        for feature in state[0]:
+            self.add(feature)
+
+    def add(self, feature):
+        self.features.append(feature)
+        getattr(self, _featureLists[feature.kind]).append(feature)
+
+_featureLists = {
+    'val' : 'values',
+    'fun' : 'functions',
+    'get' : 'functions',
+    'set' : 'functions',
+    'evt' : 'events',
+    'enu' : 'enumerations',
+    'lex' : 'lexers',
+    'cat' : 'categories',
+}
+
+#----------------------------------------------------------------------------
+
+def _parseParam(param):
+    param = param.strip()
+    if param == '':
+        return None
+    return tuple(param.split())
+
+
+def _parseVal(lineno, body, icat, docs):
+    try:
+        name, value = body.split('=')
+    except ValueError:
+        raise IfaceError(lineno, 'invalid value definition "%s"' % body)
+    return Value(lineno, icat, docs, name, value)
+
+
+def _parseFun(lineno, kind, body, icat, docs):
+    mo = _funRegex.match(body)
+    if mo is None:
+        raise IfaceError(lineno, 'invalid function definition "%s"' % body)
+
+    retType, name, number, param1, param2 = mo.groups()
+    return Function(lineno, icat, docs, kind, retType, name, number,
+                    _parseParam(param1), _parseParam(param2))
+
+
+def _parseEvt(lineno, body, icat, docs):
+    mo = _evtRegex.match(body)
+    if mo is None:
+        raise IfaceError(lineno, 'invalid event definition "%s"' % body)
+
+    retType, name, number, params = mo.groups()
+    params = [p for p in map(_parseParam, params.split(',')) if p]
+    return Event(lineno, icat, docs, retType, name, number, params)
+
+
+def _parseList(lineno, body):
+    mo = _listRegex.match(body)
+    if mo is None:
+        raise IfaceError(lineno, 'invalid definition "%s"' % body)
+    return mo.group(1), mo.group(2).split()
+
+
+def parseText(text):
+    """Parse the contents of an iface file and return an Interface object.
+
+    IfaceError is raised if a feature definition is invalid, while unknown
+    lines are reported and otherwise ignored.
+    """
+    iface = Interface()
+    icat = 'Basics'
+    docs = []
+
+    lineno = 0
+    for mo in _lineRegex.finditer(text):
+        lineno += 1
+        kind = mo.group('kind')
+        if kind is not None:
+            body = mo.group('body')
+            if kind == 'val':
+                iface.add(_parseVal(lineno, body, icat, docs))
+                docs = []
+            elif kind == 'fun' or kind == 'get' or kind == 'set':
+                iface.add(_parseFun(lineno, kind, body, icat, docs))
+                docs = []
+            elif kind == 'cat':
+                icat = body.strip()
+                iface.add(Category(lineno, icat, docs, icat))
+                docs = []
+            elif kind == 'evt':
+                iface.add(_parseEvt(lineno, body, icat, []))
+            elif kind == 'enu':
+                name, prefixes = _parseList(lineno, body)
+                iface.add(Enumeration(lineno, icat, [], name, prefixes))
+            elif kind == 'lex':
+                name, prefixes = _parseList(lineno, body)
+                iface.add(Lexer(lineno, icat, [], name,
+                                prefixes[0] if prefixes else '',
+                                prefixes[1:]))
+            else:
+                print('***** Unknown line type: %s' % mo.group(0))
+        elif mo.group('doc') is not None:
+            docs.append(mo.group('doc'))
+        elif mo.group('other') is not None:
+            print('***** Unknown line type: %s' % mo.group(0))
+
+    return iface
+
+
+def parseFile(filename):
+    """Parse the given iface file and return an Interface object."""
+    return parseText(open(filename).read())
+
+#----------------------------------------------------------------------------
+
+class RangeSet(object):
+    """Set of integers given as a list of single values and (min, max) ranges.
+
+    The membership test is done using binary search over the sorted ranges.
+    """
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, items):
+        ranges = []
+        for item in items:
+            if isinstance(item, tuple):
+                ranges.append(item)
+            else:
+                ranges.append((item, item))
+        ranges.sort()
+
+        self.starts = [r[0] for r in ranges]
+        self.ends = [r[1] for r in ranges]
+
+    def __contains__(self, num):
+        i = bisect_right(self.starts, num)
+        return i > 0 and num <= self.ends[i - 1]